@@ -23,5 +23,9 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 from .benford import *
+from .accumulator import BenfordAccumulator
+from .multi import analyze_columns, analyze_groups
+from .readers import read_npy, read_raw, read_csv
+from .monitor import EWMAMonitor, DriftMonitor
 
 __version__ = '0.2.7'
@@ -0,0 +1,288 @@
+from copy import deepcopy
+from struct import Struct
+from numpy import zeros, int64, float64, absolute, frombuffer, concatenate, \
+    nan, isnan, iinfo
+from .constants import digs_dict, rev_digs
+from .checks import _check_confidence_, _check_decimals_, _check_sign_, \
+    _check_test_
+from .utils import scale_records, extract_digits, digit_counts, \
+    mantissa_moments, get_mantissas, _bins_
+from .benford import Test, Summ, Mantissas
+
+
+# Serialization layout: magic, format version, decimals (-1 for 'infer'),
+# sign, limit_N (-1 for None), confidence (NaN for None), n_seen and
+# n_records, all little endian, followed by a one byte tag of the counts
+# dtype (the narrowest of _COUNTS_DTYPES_ to hold the largest count), the
+# counts, the sums of the bins with records (the others are zero) and the
+# moments (float64). Version 1 buffers (no tag, int64 counts, all the sums)
+# are still read.
+_MAGIC_ = b'BNFA'
+_VERSION_ = 2
+_HEADER_ = Struct('<4sHhBqdqq')
+_COUNTS_DTYPES_ = ['<u1', '<u2', '<u4', '<i8']
+_SIGNS_ = ['all', 'pos', 'neg']
+
+
+class BenfordAccumulator(object):
+    """Builds the Benford tests incrementally, from data received chunk by
+    chunk, so that series too large to fit in memory can be analysed. Only
+    the aggregates are kept: the digits histograms of the five tests, the
+    sums of the records by first digits (for the Summation tests) and the
+    mantissas moments, so memory does not grow with the number of records.
+    The Second Order tests need the whole sample sorted: they are built with
+    test(sec_order=True) from an accumulator fed with the differences of the
+    sorted records, as readers.accumulate_sec_order does out of core.
+
+    Accumulators of different partitions of a series can be merged (with
+    merge() or +) into the accumulator of the whole series, and serialized
+    with to_bytes(), to be rebuilt with from_bytes(), so the partitions can
+    be processed in separate processes or machines. The serialized size
+    grows with the digit bins filled, from about 1 KB to about 12 KB once
+    all the F3D bins have records, since the sums are kept at full float64
+    precision.
+
+    Args:
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+        confidence: confidence level to draw lower and upper limits when
+            plotting and to limit the top deviations to show, as well as to
+            calculate critical values for the tests' statistics. Defaults to 95.
+        limit_N: sets a limit to N as the sample size for the calculation of
+            the Z scores if the sample is too big. Defaults to None.
+
+    Attributes:
+        n_seen (int): number of records received so far
+        n_records (int): number of records of the chosen sign received so far
+        counts (dict): digits histogram (array) of each test, by test name
+        sums (dict): sums of the absolute values of the records by their
+            F1D, F2D and F3D digits (arrays), by test name
+        moments: mantissas sums, as given by utils.mantissa_moments
+    """
+
+    def __init__(self, decimals=2, sign='all', confidence=95, limit_N=None):
+        self.decimals = _check_decimals_(decimals)
+        self.sign = _check_sign_(sign)
+        self.confidence = _check_confidence_(confidence)
+        self.limit_N = limit_N
+        self.n_seen = 0
+        self.n_records = 0
+        self.counts = {}
+        for digs, col in digs_dict.items():
+            lo, hi = _bins_(digs)
+            self.counts[col] = zeros(hi - lo, dtype=int64)
+        self.sums = {col: zeros(len(self.counts[col]), dtype=float64)
+                     for col in ['F1D', 'F2D', 'F3D']}
+        self.moments = zeros(7, dtype=float64)
+
+    def update(self, chunk):
+        """Adds a chunk of records to the aggregates.
+
+        Args:
+            chunk: numpy 1D array or pandas Series of integers or floats.
+
+        Returns:
+            The accumulator itself, so that calls can be chained.
+        """
+        seq, ZN = scale_records(chunk, self.decimals, self.sign)
+        ab = absolute(seq).astype(float64)
+        for col, digits in extract_digits(ZN).items():
+            digs = rev_digs[col]
+            self.counts[col] += digit_counts(digits, digs)
+            if col in self.sums:
+                self.sums[col] += digit_counts(digits, digs, weights=ab)
+        self.moments += mantissa_moments(get_mantissas(ab))
+        self.n_seen += len(chunk)
+        self.n_records += len(seq)
+        return self
+
+    def _check_mergeable_(self, other):
+        """Raises a ValueError if the other accumulator's records were not
+        pre-processed in the same way.
+        """
+        if not isinstance(other, BenfordAccumulator):
+            raise ValueError('Only BenfordAccumulator objects can be merged.')
+        if (self.decimals, self.sign) != (other.decimals, other.sign):
+            raise ValueError('Accumulators with different decimals or sign '
+                             'cannot be merged.')
+
+    def merge(self, other):
+        """Adds the aggregates of another accumulator, as if its records had
+        been received by this one.
+
+        Args:
+            other: BenfordAccumulator with the same decimals and sign.
+
+        Returns:
+            The accumulator itself.
+
+        Raises:
+            ValueError: if the decimals or sign of the accumulators differ.
+        """
+        self._check_mergeable_(other)
+        for col in self.counts:
+            self.counts[col] += other.counts[col]
+        for col in self.sums:
+            self.sums[col] += other.sums[col]
+        self.moments += other.moments
+        self.n_seen += other.n_seen
+        self.n_records += other.n_records
+        return self
+
+    def __add__(self, other):
+        self._check_mergeable_(other)
+        return deepcopy(self).merge(other)
+
+    def to_bytes(self):
+        """Serializes the accumulator into a stable, platform independent
+        binary format.
+
+        Returns:
+            bytes
+        """
+        decimals = -1 if self.decimals == 'infer' else self.decimals
+        limit_N = -1 if self.limit_N is None else self.limit_N
+        confidence = nan if self.confidence is None else self.confidence
+        header = _HEADER_.pack(_MAGIC_, _VERSION_, decimals,
+                               _SIGNS_.index(self.sign), limit_N,
+                               confidence, self.n_seen, self.n_records)
+        counts = concatenate(list(self.counts.values()))
+        top = counts.max() if len(counts) else 0
+        tag = next(i for i, dt in enumerate(_COUNTS_DTYPES_)
+                   if top <= iinfo(dt).max)
+        # bins without records have zero sums, so they are left out
+        filled = concatenate([self.counts[col] > 0 for col in self.sums])
+        sums = concatenate(list(self.sums.values()))[filled]
+        sums = concatenate([sums, self.moments])
+        return header + bytes([tag]) + \
+            counts.astype(_COUNTS_DTYPES_[tag]).tobytes() + \
+            sums.astype('<f8').tobytes()
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        """Rebuilds an accumulator serialized with to_bytes().
+
+        Args:
+            buffer: bytes given by to_bytes().
+
+        Returns:
+            BenfordAccumulator
+
+        Raises:
+            ValueError: if the buffer is not a serialized accumulator.
+        """
+        buffer = bytes(buffer)
+        if len(buffer) < _HEADER_.size:
+            raise ValueError('Buffer too short for a BenfordAccumulator.')
+        magic, version, decimals, sign, limit_N, confidence, n_seen, \
+            n_records = _HEADER_.unpack_from(buffer)
+        if (magic != _MAGIC_) | (version not in (1, _VERSION_)):
+            raise ValueError('Buffer is not a serialized BenfordAccumulator.')
+        # confidence goes back to the keys of confs
+        if isnan(confidence):
+            confidence = None
+        elif confidence == int(confidence):
+            confidence = int(confidence)
+        acc = cls(decimals='infer' if decimals == -1 else decimals,
+                  sign=_SIGNS_[sign], confidence=confidence,
+                  limit_N=None if limit_N == -1 else limit_N)
+        n_counts = sum(len(c) for c in acc.counts.values())
+        offset = _HEADER_.size
+        dtype = '<i8'
+        if version > 1:
+            if (len(buffer) == offset) or \
+                    (buffer[offset] >= len(_COUNTS_DTYPES_)):
+                raise ValueError('Buffer is not a serialized '
+                                 'BenfordAccumulator.')
+            dtype = _COUNTS_DTYPES_[buffer[offset]]
+            offset += 1
+        width = iinfo(dtype).bits // 8
+        if len(buffer) < offset + width * n_counts:
+            raise ValueError('Buffer is not a serialized BenfordAccumulator.')
+        counts = frombuffer(buffer, dtype=dtype, count=n_counts,
+                            offset=offset).astype(int64)
+        offset += width * n_counts
+        start = 0
+        for col, arr in acc.counts.items():
+            arr[:] = counts[start:start + len(arr)]
+            start += len(arr)
+        # version 1 kept the sums of every bin
+        filled = concatenate([acc.counts[col] > 0 for col in acc.sums])
+        filled |= version == 1
+        if len(buffer) != offset + 8 * (filled.sum() + len(acc.moments)):
+            raise ValueError('Buffer is not a serialized BenfordAccumulator.')
+        sums = frombuffer(buffer, dtype='<f8', offset=offset).astype(float64)
+        flat = zeros(len(filled), dtype=float64)
+        flat[filled] = sums[:-len(acc.moments)]
+        start = 0
+        for col, arr in acc.sums.items():
+            arr[:] = flat[start:start + len(arr)]
+            start += len(arr)
+        acc.moments[:] = sums[-len(acc.moments):]
+        acc.n_seen, acc.n_records = n_seen, n_records
+        return acc
+
+    @property
+    def discarded(self):
+        """dict: number of records too small for each test so far."""
+        return {col: self.n_records - int(counts.sum())
+                for col, counts in self.counts.items()}
+
+    def update_confidence(self, new_conf):
+        """Sets a new confidence level, to be used by the tests built from
+        then on.
+
+        Args:
+            new_conf: new confidence level.
+        """
+        self.confidence = _check_confidence_(new_conf)
+
+    def test(self, test, sec_order=False):
+        """Builds a Test from the records received so far.
+
+        Args:
+            test: the test to build: 1 or 'F1D', 2 or 'F2D', 3 or 'F3D',
+                22 or 'SD', -2 or 'L2D'.
+            sec_order: names the test as a Second Order one, for
+                accumulators of the differences between the ordered records.
+                Defaults to False.
+
+        Returns:
+            Test object, with its Z scores, chi-square, KS, MAD and MSE.
+        """
+        digs = _check_test_(test)
+        return Test(None, digs, confidence=self.confidence,
+                    limit_N=self.limit_N, sec_order=sec_order,
+                    counts=self.counts[digs_dict[digs]])
+
+    def summation(self, test=2):
+        """Builds a Summation test from the records received so far.
+
+        Args:
+            test: 1 or 'F1D', 2 or 'F2D', 3 or 'F3D'. Defaults to 2.
+
+        Returns:
+            Summ object.
+
+        Raises:
+            ValueError: if the test is not one of the First Digits ones.
+        """
+        digs = _check_test_(test)
+        if digs not in [1, 2, 3]:
+            raise ValueError('Summation is only available for the First, '
+                             'First Two and First Three Digits tests.')
+        col = digs_dict[digs]
+        return Summ(None, col, sums=self.sums[col])
+
+    def mantissas(self):
+        """Builds the Mantissas stats from the records received so far (no
+        plots, since the mantissas themselves are not kept).
+
+        Returns:
+            Mantissas object.
+        """
+        return Mantissas(None, moments=self.moments.copy())
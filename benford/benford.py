@@ -1,16 +1,15 @@
 import warnings
 from pandas import Series, DataFrame
-from numpy import arange, log10, ones, abs, cos, sin, pi, mean
+from numpy import arange, ones, abs, cos, sin, pi, mean, asarray
 from .constants import confs, digs_dict, sec_order_dict, rev_digs, names, \
     mad_dict, crit_chi2, KS_crit
 from .checks import _check_digs_, _check_confidence_, _check_test_, \
-    _check_num_array_, _check_high_Z_
+    _check_num_array_, _check_high_Z_, _check_stats_
 from .utils import _set_N_, input_data, prepare, \
-    subtract_sorted, prep_to_roll, mad_to_roll, mse_to_roll, \
-    get_mantissas
-from .expected import First, Second, LastTwo, _test_
-from .viz import _get_plot_args, plot_digs, plot_sum, plot_ordered_mantissas,\
-    plot_mantissa_arc_test, plot_roll_mse, plot_roll_mad
+    sorted_diffs, rolling_stats, rolling_tests_stats, scale_records, \
+    get_mantissas, extract_digits, infer_ZN, narrow_uint, digit_counts, \
+    digit_sums, mantissa_moments, mantissas_stats, _sign_mask_
+from .expected import First, Second, LastTwo, _expected_, _index_
 from .reports import _inform_, _report_mad_, _report_test_, _deprecate_inform_,\
     _report_mantissa_
 from .stats import Z_score, chi_sq, chi_sq_2, kolmogorov_smirnov,\
@@ -26,17 +25,24 @@ class Base(DataFrame):
             integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.`
+        compact: stores ZN in the narrowest unsigned integer dtype that fits
+            it and the digits columns as uint8 (uint16 for F3D), with the
+            dtype's maximum instead of -1 marking the records to discard.
+            Defaults to False.
+        cols: list with the digits columns to extract (F1D, F2D, F3D, SD,
+            L2D). Others can be added later with add_digits(). Defaults to
+            None, for all of them.
 
     Raises:
         TypeError: if not receiving `int` or `float` as input.
     """
 
-    def __init__(self, data, decimals, sign='all', sec_order=False):
+    def __init__(self, data, decimals, sign='all', sec_order=False,
+                 compact=False, cols=None):
 
         DataFrame.__init__(self, {'seq': data})
 
@@ -60,29 +66,30 @@ class Base(DataFrame):
             self['ZN'] = ab
         else:
             if decimals == 'infer':
-                self['ZN'] = ab.astype(str).str\
-                               .replace('.', '')\
-                               .str.lstrip('0')\
-                               .str[:5].astype(int)
+                self['ZN'] = infer_ZN(ab)
             else:
                 self['ZN'] = (ab * (10 ** decimals)).astype(int)
-        # First digits
-        for col in ['F1D', 'F2D', 'F3D']:
-            temp = self.ZN.loc[self.ZN >= 10 ** (rev_digs[col] - 1)]
-            self[col] = (temp // 10 ** ((log10(temp).astype(int)) -
-                                        (rev_digs[col] - 1)))
-            # fill NANs with -1, which is a non-usable value for digits,
-            # to be discarded later.
-            self[col] = self[col].fillna(-1).astype(int)
-        # Second digit
-        temp_sd = self.loc[self.ZN >= 10]
-        self['SD'] = (temp_sd.ZN // 10**((log10(temp_sd.ZN)).astype(int) -
-                                         1)) % 10
-        self['SD'] = self['SD'].fillna(-1).astype(int)
-        # Last two digits
-        temp_l2d = self.loc[self.ZN >= 1000]
-        self['L2D'] = temp_l2d.ZN % 100
-        self['L2D'] = self['L2D'].fillna(-1).astype(int)
+        if compact:
+            self['ZN'] = narrow_uint(self.ZN)
+        # fill with -1 (or the compact sentinel), a non-usable value for
+        # digits, the records too small for each test, to be discarded later.
+        for col, digits in extract_digits(self.ZN, cols,
+                                          compact=compact).items():
+            self[col] = digits
+
+    def add_digits(self, col):
+        """Extracts a digits column left out at instantiation.
+
+        Args:
+            col: the test column: F1D, F2D, F3D, SD or L2D.
+
+        Returns:
+            The digits column.
+        """
+        if col not in self.columns:
+            self[col] = extract_digits(self.ZN, [col], compact=self.ZN.dtype
+                                       .kind == 'u')[col]
+        return self[col]
 
 
 class Test(DataFrame):
@@ -98,6 +105,10 @@ class Test(DataFrame):
             plotting and to limit the top deviations to show.
         limit_N: sets a limit to N as the sample size for the calculation of
                 the Z scores if the sample is too big. Defaults to None.
+        sec_order: True if the test is a Second Order one. Defaults to False.
+        counts: array with the occurrences of each of the test's possible
+            digits, as given by utils.digit_counts, to build the test from
+            instead of the base, which can then be None. Defaults to None.
 
     Attributes:
         N: Number of records in the sample to consider in computations
@@ -111,18 +122,21 @@ class Test(DataFrame):
         sec_order (bool): True if the test is a Second Order one
     """
 
-    def __init__(self, base, digs, confidence, limit_N=None, sec_order=False):
-        # create a separated Expected distributions object
-        super(Test, self).__init__(_test_(digs))
-        # create column with occurrences of the digits in the base
-        self['Counts'] = base[digs_dict[digs]].value_counts()
-        # create column with relative frequencies
-        self['Found'] = base[digs_dict[digs]].value_counts(normalize=True)
-        self.fillna(0, inplace=True)
-        # create column with absolute differences
-        self['Dif'] = self.Found - self.Expected
-        self['AbsDif'] = self.Dif.abs()
-        self.N = _set_N_(len(base), limit_N)
+    def __init__(self, base, digs, confidence, limit_N=None, sec_order=False,
+                 counts=None):
+        if counts is None:
+            # occurrences of each of the test's digits in the base
+            counts = digit_counts(base[digs_dict[digs]], digs)
+        total = int(counts.sum())
+        # the cached Expected distribution, the occurrences, the relative
+        # frequencies and their differences, all set at once
+        expected = _expected_(digs)[0]
+        found = counts / max(total, 1)
+        dif = found - expected
+        super(Test, self).__init__({'Expected': expected, 'Counts': counts,
+                                    'Found': found, 'Dif': dif,
+                                    'AbsDif': abs(dif)}, index=_index_(digs))
+        self.N = _set_N_(total, limit_N)
         self['Z_score'] = Z_score(self, self.N)
         self.ddf = len(self) - 1
         self.chi_square = chi_sq_2(self)
@@ -176,6 +190,7 @@ class Test(DataFrame):
             Only available when save_plot is a string with the figure file
             path/name.
         """
+        from .viz import _get_plot_args, plot_digs
         x, figsize, text_x = _get_plot_args(self.digs)
         plot_digs(self, x=x, y_Exp=self.Expected, y_Found=self.Found,
                     N=self.N, figsize=figsize, conf_Z=confs[self.confidence],
@@ -218,15 +233,23 @@ class Summ(DataFrame):
     Args:
        base: The Base object with the data prepared for Analysis
        test: The test for which to compute the summation
+       sums: array with the sums of the absolute values for each of the test's
+           possible digits, as given by utils.digit_sums, to build the test
+           from instead of the base, which can then be None. Defaults to None.
     """
 
-    def __init__(self, base, test):
-        super(Summ, self).__init__(base.abs()
-                                   .groupby(test)[['seq']]
-                                   .sum())
-        self['Percent'] = self.seq / self.seq.sum()
-        self.columns.values[0] = 'Sum'
-        self.expected = 1 / len(self)
+    def __init__(self, base, test, sums=None):
+        if sums is None:
+            sums = digit_sums(base[test], rev_digs[test], base.seq.abs())
+        # keep only the digits found
+        lo = 10 ** (rev_digs[test] - 1)
+        sums = Series(sums, index=arange(lo, lo + len(sums)), name=test)
+        sums = sums.loc[sums > 0].rename_axis(test)
+        super(Summ, self).__init__({'Sum': sums})
+        self['Percent'] = self.Sum / self.Sum.sum()
+        # each of the test's possible digits is expected to sum the same,
+        # also when none of the records is large enough for the test
+        self.expected = 1 / (9 * 10 ** (rev_digs[test] - 1))
         self['AbsDif'] = (self.Percent - self.expected).abs()
         self.index = self.index.astype(int)
         #: Mean Absolute Deviation for the test
@@ -254,6 +277,7 @@ class Summ(DataFrame):
             
         """
         figsize=(2 * (self.digs ** 2 + 5), 1.5 * (self.digs ** 2 + 5))
+        from .viz import plot_sum
         plot_sum(self, figsize, self.expected,
                  save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
     
@@ -337,6 +361,7 @@ class Mantissas(object):
                 Only available when save_plot is a string with the figure file
                 path/name.
         """
+        from .viz import plot_ordered_mantissas
         plot_ordered_mantissas(self.data.Mantissa, figsize=figsize,
                                save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
 
@@ -369,6 +394,7 @@ class Mantissas(object):
             self.stats['gravity_center'] = (self.data.mant_x.mean(),
                                             self.data.mant_y.mean())
         
+        from .viz import plot_mantissa_arc_test
         plot_mantissa_arc_test(self.data, self.stats, decimals=decimals, 
                                grid=grid, figsize=figsize,
                                save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
@@ -386,8 +412,7 @@ class Benford(object):
             of the chosen column. Values must be integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
@@ -406,43 +431,59 @@ class Benford(object):
             the Z scores if the sample is too big. Defaults to None.
         verbose: gives some information about the data and the registries used
             and discarded for each test.
+        compact: keeps the Base (and the second order one) in compact dtypes,
+            with ZN in the narrowest unsigned integer that fits it and the
+            digits as uint8/uint16, for about a third of the memory.
+            Defaults to False.
+        tests: list with the tests (F1D, F2D, F3D, SD, L2D, or their
+            numbers) to build at instantiation, extracting only the digits
+            they need. The others are built on first access (obj.F3D) if the
+            Base is kept. Defaults to None, for all of them.
+        keep_base: keeps the raw data and the per-record Base after the tests
+            are built. If False (counts-only), the tests are built from the
+            digits histograms and only aggregates are retained: the sums of
+            the records by first digits, for summation(), and the mantissas
+            moments, for mantissas() (stats only, no plots). sec_order() then
+            needs to be requested at instantiation. Defaults to True.
 
     Attributes:
-        data: the raw data provided for the analysis
+        data: the raw data provided for the analysis (None if counts-only)
         chosen: the column of the DataFrame to be analysed or the data itself
+            (None if counts-only)
         sign (str): which number sign(s) to include in the analysis
         confidence: current confidence level
         limit_N (int): sample size to use in computations
         verbose (bool): verbose or not
-        base: the Base, pre-processed object
+        base: the Base, pre-processed object (None if counts-only)
         tests (:obj:`list` of :obj:`str`): keeps track of the tests the
             instance has
     """
 
     def __init__(self, data, decimals=2, sign='all', confidence=95,
                  mantissas=False, sec_order=False, summation=False,
-                 limit_N=None, verbose=True):
+                 limit_N=None, verbose=True, compact=False, keep_base=True,
+                 tests=None):
         self.data, self.chosen = input_data(data)
         self.decimals = decimals
         self.sign = sign
         self.confidence = _check_confidence_(confidence)
         self.limit_N = limit_N
         self.verbose = verbose
-        self.base = Base(self.chosen, decimals, sign)
+        self.compact = compact
+        self.keep_base = keep_base
+        if tests is None:
+            self._digs = list(digs_dict)
+        else:
+            self._digs = [_check_test_(test) for test in tests]
+        self.base = Base(self.chosen, decimals, sign, compact=compact,
+                         cols=[digs_dict[digs] for digs in self._digs])
         self.tests = []
+        # dict with the numbers of discarded entries for each test column
+        self._discarded = {}
 
         # Create a DatFrame for each Test
-        for key, val in digs_dict.items():
-            test = Test(self.base.loc[self.base[val] != -1],
-                        digs=key, confidence=self.confidence,
-                        limit_N=self.limit_N)
-            setattr(self, val, test)
-            self.tests.append(val)
-        # dict with the numbers of discarded entries for each test column
-        self._discarded = {key: val for (key, val) in
-                           zip(digs_dict.values(),
-                               [len(self.base[col].loc[self.base[col] == -1])
-                                for col in digs_dict.values()])}
+        for key in self._digs:
+            self._add_test_(key)
 
         if self.verbose:
             print('\n', ' Benford Object Instantiated '.center(50, '#'), '\n')
@@ -451,6 +492,14 @@ class Benford(object):
             print(
                 f'Number of discarded entries for each test:\n{self._discarded}')
 
+        if not keep_base:
+            # the aggregates summation() and mantissas() need later on
+            ab = self.base.seq.abs()
+            self._summ_sums = {test: digit_sums(self.base.add_digits(test),
+                                                rev_digs[test], ab)
+                               for test in ['F1D', 'F2D', 'F3D']}
+            self._mant_moments = mantissa_moments(get_mantissas(ab))
+
         if mantissas:
             self.mantissas()
 
@@ -460,6 +509,38 @@ class Benford(object):
         if summation:
             self.summation()
 
+        if not keep_base:
+            self.data = self.chosen = self.base = None
+
+    def _add_test_(self, digs):
+        """Builds a Test, sets it as an attribute and keeps track of it and
+        of the records it discarded.
+        """
+        col = digs_dict[digs]
+        test = self._get_test_(self.base, digs)
+        setattr(self, col, test)
+        self.tests.append(col)
+        self._discarded[col] = len(self.base) - int(test.Counts.sum())
+        return test
+
+    def __getattr__(self, name):
+        # tests left out at instantiation are built on first access
+        base = self.__dict__.get('base')
+        if name in digs_dict.values() and base is not None:
+            return self._add_test_(rev_digs[name])
+        raise AttributeError(f"'{type(self).__name__}' object has no "
+                             f"attribute '{name}'")
+
+    def _get_test_(self, base, digs, sec_order=False):
+        """Builds a Test from a Base, straight from its digits histogram,
+        which leaves out the records discarded from the test, so that the
+        Base is not copied.
+        """
+        digits = base.add_digits(digs_dict[digs])
+        return Test(None, digs=digs, confidence=self.confidence,
+                    limit_N=self.limit_N, sec_order=sec_order,
+                    counts=digit_counts(digits, digs))
+
     def update_confidence(self, new_conf, tests=None):
         """Sets (a) new confidence level(s) for the Benford object, so as to be
         used to produce critical values for the tests.
@@ -508,37 +589,94 @@ class Benford(object):
 
     def mantissas(self):
         """Adds a Mantissas object to the tests, with all its statistics and
-        plotting capabilities.
+        plotting capabilities (only the statistics if counts-only).
         """
-        self.Mantissas = Mantissas(self.base.seq)
+        if self.keep_base:
+            self.Mantissas = Mantissas(self.base.seq)
+        else:
+            self.Mantissas = Mantissas(None, moments=self._mant_moments)
         self.tests.append('Mantissas')
         if self.verbose:
             print('\nAdded Mantissas test.')
 
-    def sec_order(self):
+    def sec_order(self, run_size=None):
         """Runs the Second Order tests, which are the Benford's tests
         performed on the differences between the ordered sample (a value minus
         the one before it, and so on). If the original series is Benford-
         compliant, this new sequence should aldo follow Beford. The Second
         Order can also be called separately, through the method sec_order().
+
+        Args:
+            run_size: if given, sorts the records out of core, run_size of
+                them at a time, in runs saved to temporary files, so the
+                sort and the differences take no more memory than that, and
+                builds the tests from the differences' counts only, as with
+                keep_base=False. The records themselves are still in memory:
+                for data larger than memory, use readers.read_npy or
+                readers.read_raw with sec_order=True, the only fully out of
+                core paths. Defaults to None, for an in-memory sort.
+
+        Raises:
+            ValueError: if the instance is counts-only and the records are
+                no longer available.
         """
-        #: Base instance of the differences between the ordered sample
-        self.base_sec = Base(subtract_sorted(self.chosen),
-                             decimals=self.decimals, sign=self.sign)
-        for key, val in digs_dict.items():
-            test = Test(self.base_sec.loc[self.base_sec[val] != -1],
-                        digs=key, confidence=self.confidence,
-                        limit_N=self.limit_N, sec_order=True)
+        if self.chosen is None:
+            raise ValueError('The records were not kept (keep_base=False). '
+                             'Instantiate with sec_order=True to run the '
+                             'Second Order tests.')
+        if run_size is not None:
+            from .readers import accumulate_sec_order
+            acc = accumulate_sec_order(
+                self.chosen.to_numpy(), run_size, sign=self.sign,
+                sign_first=False, decimals=self.decimals,
+                confidence=self.confidence, limit_N=self.limit_N)
+            self.base_sec = None
+            self._discarded_sec = {}
+            for key in self._digs:
+                col = digs_dict[key]
+                setattr(self, sec_order_dict[key], acc.test(key,
+                                                            sec_order=True))
+                self.tests.append(f'{col}_sec')
+                self._discarded_sec[sec_order_dict[key]] = \
+                    acc.discarded[col]
+            if self.verbose:
+                print(f'\nSecond order tests run in {acc.n_records} '
+                      'registries.\n\nNumber of discarded entries for second '
+                      f'order tests:\n{self._discarded_sec}')
+            return
+        diffs = sorted_diffs(self.chosen)
+        cols = [digs_dict[key] for key in self._digs]
+        if self.keep_base:
+            #: Base instance of the differences between the ordered sample
+            self.base_sec = Base(diffs, decimals=self.decimals,
+                                 sign=self.sign, compact=self.compact,
+                                 cols=cols)
+            n_sec = len(self.base_sec)
+        else:
+            # the digits go straight to the histograms, with no Base
+            self.base_sec = None
+            seq, ZN = scale_records(diffs, self.decimals, self.sign)
+            n_sec = len(seq)
+            del diffs, seq
+        self._discarded_sec = {}
+        for key in self._digs:
+            if self.keep_base:
+                test = self._get_test_(self.base_sec, key, sec_order=True)
+            else:
+                # one digits column at a time
+                col = digs_dict[key]
+                test = Test(None, digs=key, confidence=self.confidence,
+                            limit_N=self.limit_N, sec_order=True,
+                            counts=digit_counts(
+                                extract_digits(ZN, [col])[col], key))
             setattr(self, sec_order_dict[key], test)
-            self.tests.append(f'{val}_sec')
+            self.tests.append(f'{digs_dict[key]}_sec')
             # No need to populate crit_vals dict, since they are the
             # same and do not depend on N
-            self._discarded_sec = {key: val for (key, val) in zip(
-                                   sec_order_dict.values(),
-                                   [sum(self.base_sec[col] == -1) for col in
-                                    digs_dict.values()])}
+            self._discarded_sec[sec_order_dict[key]] = n_sec - \
+                int(test.Counts.sum())
         if self.verbose:
-            print(f'\nSecond order tests run in {len(self.base_sec)} '
+            print(f'\nSecond order tests run in {n_sec} '
                   'registries.\n\nNumber of discarded entries for second order'
                   f' tests:\n{self._discarded_sec}')
 
@@ -546,7 +684,14 @@ class Benford(object):
         """Creates Summation test DataFrames from Base object"""
         for test in ['F1D', 'F2D', 'F3D']:
             t = f'{test}_Summ'
-            setattr(self, t, Summ(self.base, test))
+            if self.keep_base:
+                # the records too small for the test are left out
+                summ = Summ(None, test, sums=digit_sums(
+                    self.base.add_digits(test), rev_digs[test],
+                    self.base.seq.abs()))
+            else:
+                summ = Summ(None, test, sums=self._summ_sums[test])
+            setattr(self, t, summ)
             self.tests.append(t)
 
         if self.verbose:
@@ -562,8 +707,7 @@ class Source(DataFrame):
             integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
@@ -571,6 +715,8 @@ class Source(DataFrame):
             differences between the ordered entries before running the Tests.
         verbose: tells the number of registries that are being subjected to
             the analysis; defaults to True.
+        compact: stores ZN in the narrowest unsigned integer dtype that fits
+            it. Defaults to False.
 
     Raises:
         ValueError: if the `sign` arg is not in ['all', 'pos', 'neg']
@@ -578,35 +724,46 @@ class Source(DataFrame):
     """
 
     def __init__(self, data, decimals=2, sign='all', sec_order=False,
-                 verbose=True, inform=None):
+                 verbose=True, inform=None, compact=False):
 
         if sign not in ['all', 'pos', 'neg']:
             raise ValueError("The -sign- argument must be "
                              "'all','pos' or 'neg'.")
 
-        DataFrame.__init__(self, {'seq': data})
+        if sec_order:
+            # the differences are taken on a numpy buffer before building
+            # the frame, which holds only them, with an index of their own
+            seq = asarray(data)
+            if seq.dtype != 'float64' and seq.dtype != 'int64':
+                raise TypeError('The sequence dtype was not pandas int64 nor float64.\n'
+                                'Convert it to whether int64 of float64, and try again.')
+            seq = seq[_sign_mask_(seq, sign)]
+            n_records = len(seq)
+            DataFrame.__init__(self, {'seq': sorted_diffs(seq,
+                                                          overwrite=True)})
+            del seq
+        else:
+            DataFrame.__init__(self, {'seq': data})
 
-        if self.seq.dtypes != 'float64' and self.seq.dtypes != 'int64':
-            raise TypeError('The sequence dtype was not pandas int64 nor float64.\n'
-                            'Convert it to whether int64 of float64, and try again.')
+            if self.seq.dtypes != 'float64' and self.seq.dtypes != 'int64':
+                raise TypeError('The sequence dtype was not pandas int64 nor float64.\n'
+                                'Convert it to whether int64 of float64, and try again.')
 
-        if sign == 'pos':
-            self.seq = self.seq.loc[self.seq > 0]
-        elif sign == 'neg':
-            self.seq = self.seq.loc[self.seq < 0]
-        else:
-            self.seq = self.seq.loc[self.seq != 0]
+            if sign == 'pos':
+                self.seq = self.seq.loc[self.seq > 0]
+            elif sign == 'neg':
+                self.seq = self.seq.loc[self.seq < 0]
+            else:
+                self.seq = self.seq.loc[self.seq != 0]
 
-        self.dropna(inplace=True)
+            self.dropna(inplace=True)
+            n_records = len(self)
         #: (bool): verbose or not
         self.verbose = _deprecate_inform_(verbose, inform)
         if self.verbose:
-            print(f"\nInitialized sequence with {len(self)} registries.")
+            print(f"\nInitialized sequence with {n_records} registries.")
 
         if sec_order:
-            self.seq = subtract_sorted(self.seq.copy())
-            self.dropna(inplace=True)
-            self.reset_index(inplace=True)
             if verbose:
                 print('Second Order Test. Initial series reduced '
                       f'to {len(self.seq)} entries.')
@@ -617,14 +774,11 @@ class Source(DataFrame):
             self['ZN'] = ab
         else:
             if decimals == 'infer':
-                # There is some numerical issue with Windows that required
-                # implementing it differently (and slower)
-                self['ZN'] = ab.astype(str)\
-                               .str.replace('.', '')\
-                               .str.lstrip('0').str[:5]\
-                               .astype(int)
+                self['ZN'] = infer_ZN(ab)
             else:
                 self['ZN'] = (ab * (10 ** decimals)).astype(int)
+        if compact:
+            self['ZN'] = narrow_uint(self.ZN)
 
     def mantissas(self, report=True, show_plot=True, figsize=(15, 8),
                   save_plot=None, save_plot_kwargs=None):
@@ -657,6 +811,7 @@ class Source(DataFrame):
             print(f"The Mantissas KURTOSIS is {p.Mant.kurt()}. \tRef: -1.2.")
 
         if show_plot:
+            from .viz import plot_ordered_mantissas
             plot_ordered_mantissas(self.Mant, figsize=figsize,
                                    save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
 
@@ -713,21 +868,17 @@ class Source(DataFrame):
         # Check on possible digits
         _check_test_(digs)
 
-        temp = self.loc[self.ZN >= 10 ** (digs - 1)]
-        temp[digs_dict[digs]] = (temp.ZN // 10 ** ((log10(temp.ZN).astype(
-                                                   int)) - (digs - 1))).astype(
-                                                       int)
+        temp = extract_digits(self.ZN, [digs_dict[digs]])[digs_dict[digs]]
+        temp = temp[temp != -1]
         n, m = 10 ** (digs - 1), 10 ** (digs)
         x = arange(n, m)
 
         if simple:
             self.verbose = False
             show_plot = False
-            df = prepare(temp[digs_dict[digs]], digs, limit_N=limit_N,
-                         simple=True)
+            df = prepare(temp, digs, limit_N=limit_N, simple=True)
         else:
-            N, df = prepare(temp[digs_dict[digs]], digs, limit_N=limit_N,
-                            simple=False)
+            N, df = prepare(temp, digs, limit_N=limit_N, simple=False)
 
         if self.verbose:
             print(f"\nTest performed on {len(temp)} registries.\n"
@@ -758,6 +909,7 @@ class Source(DataFrame):
 
         # Plotting the expected frequncies (line) against the found ones(bars)
         if show_plot:
+            from .viz import plot_digs
             plot_digs(df, x=x, y_Exp=df.Expected, y_Found=df.Found, N=N,
                        figsize=(2 * (digs ** 2 + 5), 1.5 * (digs ** 2 + 5)),
                        conf_Z=confs[confidence], save_plot=save_plot,
@@ -812,16 +964,15 @@ class Source(DataFrame):
 
         conf = confs[confidence]
 
-        temp = self.loc[self.ZN >= 10, :]
-        temp['SD'] = (temp.ZN // 10 ** ((log10(temp.ZN)).astype(
-                      int) - 1)) % 10
+        temp = extract_digits(self.ZN, ['SD'])['SD']
+        temp = temp[temp != -1]
 
         if simple:
             self.verbose = False
             show_plot = False
-            df = prepare(temp['SD'], 22, limit_N=limit_N, simple=True)
+            df = prepare(temp, 22, limit_N=limit_N, simple=True)
         else:
-            N, df = prepare(temp['SD'], 22, limit_N=limit_N, simple=False)
+            N, df = prepare(temp, 22, limit_N=limit_N, simple=False)
 
         if self.verbose:
             print(f"\nTest performed on {len(temp)} registries.\nDiscarded "
@@ -849,6 +1000,7 @@ class Source(DataFrame):
 
         # Plotting the expected frequncies (line) against the found ones(bars)
         if show_plot:
+            from .viz import plot_digs
             plot_digs(df, x=arange(0, 10), y_Exp=df.Expected,
                        y_Found=df.Found, N=N, figsize=(10, 6), conf_Z=conf,
                        save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
@@ -899,15 +1051,15 @@ class Source(DataFrame):
         confidence = _check_confidence_(confidence)
         conf = confs[confidence]
 
-        temp = self.loc[self.ZN >= 1000]
-        temp['L2D'] = temp.ZN % 100
+        temp = extract_digits(self.ZN, ['L2D'])['L2D']
+        temp = temp[temp != -1]
 
         if simple:
             self.verbose = False
             show_plot = False
-            df = prepare(temp['L2D'], -2, limit_N=limit_N, simple=True)
+            df = prepare(temp, -2, limit_N=limit_N, simple=True)
         else:
-            N, df = prepare(temp['L2D'], -2, limit_N=limit_N, simple=False)
+            N, df = prepare(temp, -2, limit_N=limit_N, simple=False)
 
         if self.verbose:
             print(f"\nTest performed on {len(temp)} registries.\n\nDiscarded "
@@ -935,6 +1087,7 @@ class Source(DataFrame):
 
         # Plotting expected frequencies (line) versus found ones (bars)
         if show_plot:
+            from .viz import plot_digs
             plot_digs(df, x=arange(0, 100), y_Exp=df.Expected,
                        y_Found=df.Found, N=N, figsize=(15, 5),
                        conf_Z=conf, text_x=True, save_plot=save_plot,
@@ -972,16 +1125,16 @@ class Source(DataFrame):
             top = 9
         # Call the dict for F1D, F2D, F3D
         d = digs_dict[digs]
-        if d not in self.columns:
-            self[d] = self.ZN.astype(str).str[:digs].astype(int)
         # Call the expected proportion according to digs
         li = 1. / (9 * (10 ** (digs - 1)))
 
-        df = self.groupby(d).sum()
-        # s.drop(0, inplace=True)
-        df['Percent'] = df.ZN / df.ZN.sum()
-        df.columns.values[1] = 'Summ'
-        df = df[['Summ', 'Percent']]
+        # sums of ZN by first digits, the records too small for the test
+        # left out, keeping only the digits found
+        sums = digit_sums(extract_digits(self.ZN, [d])[d], digs, self.ZN)
+        lo = 10 ** (digs - 1)
+        sums = Series(sums, index=arange(lo, lo + len(sums)))
+        df = DataFrame({'Summ': sums.loc[sums > 0]}).rename_axis(d)
+        df['Percent'] = df.Summ / df.Summ.sum()
         df['AbsDif'] = (df.Percent - li).abs()
 
         if self.verbose:
@@ -991,6 +1144,7 @@ class Source(DataFrame):
             print(df[:top])
 
         if show_plot:
+            from .viz import plot_sum
             plot_sum(df, figsize=(
                        2 * (digs ** 2 + 5), 1.5 * (digs ** 2 + 5)), li=li,
                        save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
@@ -1044,14 +1198,23 @@ class Mantissas(object):
 
     Args:
         data: sequence to compute mantissas from, numpy 1D array, pandas
-            Series of pandas DataFrame column.
+            Series of pandas DataFrame column. May be None if moments is given.
+        moments: array with the mantissas sums, as given by
+            utils.mantissa_moments, to compute the stats from when the records
+            are not available. The plots are then unavailable. Defaults to None.
     Attributes:
         data (DataFrame): holds the computed mantissas and, if the arc_test
             is also called, the respecttive x and Y coordinates for the plot.
+            None when built from the moments.
         stats (dict): holds the relevant statistics about the data mantissas.
     """
 
-    def __init__(self, data):
+    def __init__(self, data, moments=None):
+
+        if data is None:
+            self.data = None
+            self.stats = mantissas_stats(moments)
+            return
 
         data = Series(_check_num_array_(data))
         data = data.dropna().loc[data != 0].abs()
@@ -1063,11 +1226,18 @@ class Mantissas(object):
                       'Skew': self.data.Mantissa.skew(),
                       'Kurt': self.data.Mantissa.kurt()}
 
+    def _check_data_(self):
+        """Raises a ValueError if the mantissas themselves were not kept"""
+        if self.data is None:
+            raise ValueError('The Mantissas were computed from their moments '
+                             'only, so there is nothing to plot.')
+
     def report(self, show_plot=True, save_plot=None, save_plot_kwargs=None):
         """Displays the Mantissas stats.
 
         Args:
-            show_plot: shows the ordered mantissas plot and the Arc Test plot.
+            show_plot: shows the ordered mantissas plot and the Arc Test plot,
+                unless the Mantissas were built from their moments only.
                 Defaults to True.
             save_plot: string with the path/name of the file in which the generated
                 plot will be saved. Uses matplotlib.pyplot.savefig(). File format
@@ -1088,7 +1258,10 @@ class Mantissas(object):
               "\tRef: 0.0")
         print(f"The Mantissas KURTOSIS is  {self.stats['Kurt']:.6f}."
               "\tRef: -1.2\n")
-        if show_plot:
+        if show_plot and self.data is None:
+            print('The Mantissas were computed from their moments only, so '
+                  'there is nothing to plot.\n')
+        elif show_plot:
             self.show_plot(save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
             self.arc_test(save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
 
@@ -1107,6 +1280,8 @@ class Mantissas(object):
                 Only available when save_plot is a string with the figure file
                 path/name.
         """
+        self._check_data_()
+        from .viz import plot_ordered_mantissas
         plot_ordered_mantissas(self.data.Mantissa, figsize=figsize,
                                save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
  
@@ -1130,11 +1305,13 @@ class Mantissas(object):
                 Only available when save_plot is a string with the figure file
                 path/name.
         """
+        self._check_data_()
         if self.stats.get('gravity_center') is None:
             self.data['mant_x'] = cos(2 * pi * self.data.Mantissa)
             self.data['mant_y'] = sin(2 * pi * self.data.Mantissa)
             self.stats['gravity_center'] = (self.data.mant_x.mean(),
                                             self.data.mant_y.mean())
+        from .viz import plot_mantissa_arc_test
         plot_mantissa_arc_test(self.data, self.stats['gravity_center'],
                                figsize=figsize, save_plot=save_plot,
                                save_plot_kwargs=save_plot_kwargs)
@@ -1150,18 +1327,22 @@ class Roll_mad(object):
             integers or floats.
         test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
             3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
-        window: size of the subset to be used.
+        window: size of the subset to be used: a number of records or, if
+            data is a Series with a sorted DatetimeIndex, a fixed duration,
+            such as '30D', for the records in the preceding 30 days.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
+        step: computes only every step-th window. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for one window ending at the
+            end of each period. Defaults to 1.
 
     """
 
-    def __init__(self, data, test, window, decimals=2, sign='all'):
+    def __init__(self, data, test, window, decimals=2, sign='all', step=1):
 
         #: the test (F1D, SD, F2D...) used for the MAD calculation and critical values
         self.test = _check_test_(test)
@@ -1169,12 +1350,10 @@ class Roll_mad(object):
         if not isinstance(data, Source):
             data = Source(data, sign=sign, decimals=decimals, verbose=False)
 
-        Exp, ind = prep_to_roll(data, self.test)
-
-        self.roll_series = data[digs_dict[test]].rolling(
-                                window=window).apply(mad_to_roll, 
-                                    args=(Exp, ind), raw=False)
-        self.roll_series.dropna(inplace=True)
+        col = digs_dict[self.test]
+        digits = Series(extract_digits(data.ZN, [col])[col], index=data.index)
+        self.roll_series = rolling_stats(digits, self.test, window, ['MAD'],
+                                         step=step).MAD.rename(col)
 
     def show_plot(self, figsize=(15, 8), save_plot=None, save_plot_kwargs=None):
         """Shows the rolling MAD plot
@@ -1190,6 +1369,82 @@ class Roll_mad(object):
                 Only available when save_plot is a string with the figure file
                 path/name.
         """
+        from .viz import plot_roll_mad
+        plot_roll_mad(self, figsize=figsize,
+                      save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
+
+
+class Expanding(object):
+    """Applies tests' statistics to the growing subsets of the Series made of
+    its first records, showing how they converge as the records accumulate,
+    such as along a fiscal year. All of them come from running digits
+    counts, in linear time.
+
+    Args:
+        data: sequence of numbers to be evaluated. Must be a numpy 1D array,
+            a pandas Series or a pandas DataFrame column, with values being
+            integers or floats.
+        test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
+            3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
+        stats: list with the statistics to compute, among 'N' (the number of
+            records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to
+            ('N', 'MAD', 'chi2').
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+        step: computes only every step-th subset, the records up to every
+            step-th record. With a DatetimeIndex, may be a frequency string,
+            such as 'ME', for the records up to the end of each period.
+            Defaults to 1.
+
+    Attributes:
+        test: the test (F1D, SD, F2D...) used.
+        stats: DataFrame with a column for each statistic and a row for each
+            subset, indexed by the label of its last record, or by the
+            periods' labels.
+    """
+
+    def __init__(self, data, test, stats=('N', 'MAD', 'chi2'), decimals=2,
+                 sign='all', step=1):
+
+        self.test = _check_test_(test)
+        stats = _check_stats_(stats)
+
+        if not isinstance(data, Source):
+            data = Source(data, sign=sign, decimals=decimals, verbose=False)
+
+        col = digs_dict[self.test]
+        digits = Series(extract_digits(data.ZN, [col])[col], index=data.index)
+        self.stats = rolling_stats(digits, self.test, None, stats, step=step)
+
+    @property
+    def roll_series(self):
+        """Series with the MADs, for the plot."""
+        return self.stats.MAD
+
+    def show_plot(self, figsize=(15, 8), save_plot=None, save_plot_kwargs=None):
+        """Shows the expanding MAD plot, with the MAD conformity limits.
+
+        Args:
+            figsize: the figure dimensions.
+            save_plot: string with the path/name of the file in which the generated
+                plot will be saved. Uses matplotlib.pyplot.savefig(). File format
+                is infered by the file name extension.
+            save_plot_kwargs: dict with any of the kwargs accepted by
+                matplotlib.pyplot.savefig()
+                https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
+                Only available when save_plot is a string with the figure file
+                path/name.
+
+        Raises:
+            ValueError: if the MAD was not among the statistics computed.
+        """
+        if 'MAD' not in self.stats:
+            raise ValueError("The plot needs 'MAD' among the -stats-.")
+        from .viz import plot_roll_mad
         plot_roll_mad(self, figsize=figsize,
                       save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
 
@@ -1204,29 +1459,31 @@ class Roll_mse(object):
             integers or floats.
         test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
             3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
-        window: size of the subset to be used.
+        window: size of the subset to be used: a number of records or, if
+            data is a Series with a sorted DatetimeIndex, a fixed duration,
+            such as '30D', for the records in the preceding 30 days.
             decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. 'pos': only the positive
             entries; 'neg': only negative entries; 'all': all entries but zeros.
             Defaults to 'all'.
+        step: computes only every step-th window. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for one window ending at the
+            end of each period. Defaults to 1.
     """
 
-    def __init__(self, data, test, window, decimals=2, sign='all'):
+    def __init__(self, data, test, window, decimals=2, sign='all', step=1):
 
         test = _check_test_(test)
 
         if not isinstance(data, Source):
             data = Source(data, sign=sign, decimals=decimals, verbose=False)
 
-        Exp, ind = prep_to_roll(data, test)
-
-        self.roll_series = data[digs_dict[test]].rolling(
-                                window=window).apply(mse_to_roll, 
-                                    args=(Exp, ind), raw=False)
-        self.roll_series.dropna(inplace=True)
+        col = digs_dict[test]
+        digits = Series(extract_digits(data.ZN, [col])[col], index=data.index)
+        self.roll_series = rolling_stats(digits, test, window, ['MSE'],
+                                         step=step).MSE.rename(col)
 
     def show_plot(self, figsize=(15, 8), save_plot=None, save_plot_kwargs=None):
         """Shows the rolling MSE plot
@@ -1242,6 +1499,7 @@ class Roll_mse(object):
                 Only available when save_plot is a string with the figure file
                 path/name.
         """
+        from .viz import plot_roll_mse
         plot_roll_mse(self.roll_series, figsize=figsize,
                       save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
 
@@ -1260,8 +1518,7 @@ def first_digits(data, digs, decimals=2, sign='all', verbose=True,
             integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. 'pos': only the positive
             entries; 'neg': only negative entries; 'all': all entries but zeros.
             Defaults to 'all'.
@@ -1340,8 +1597,7 @@ def second_digit(data, decimals=2, sign='all', verbose=True,
             integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. 'pos': only the positive
             entries; 'neg': only negative entries; 'all': all entries but zeros.
             Defaults to 'all'.
@@ -1417,8 +1673,7 @@ def last_two_digits(data, decimals=2, sign='all', verbose=True,
             integers or floats.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. 'pos': only the positive
             entries; 'neg': only negative entries; 'all': all entries but zeros.
             Defaults to 'all'.
@@ -1529,8 +1784,7 @@ def summation(data, digs=2, decimals=2, sign='all', top=20, verbose=True,
             3- first three. Defaults to 2.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         top: choses how many top values to show. Defaults to 20.
         show_plot: plots the results. Defaults to True.
         save_plot: string with the path/name of the file in which the generated
@@ -1552,8 +1806,8 @@ def summation(data, digs=2, decimals=2, sign='all', top=20, verbose=True,
     if not isinstance(data, Source):
         data = Source(data, sign=sign, decimals=decimals, verbose=verbose)
 
-    data = data.summation(digs=digs, top=top, verbose=verbose,
-                          show_plot=show_plot, save_plot=save_plot,
+    data = data.summation(digs=digs, top=top, show_plot=show_plot,
+                          save_plot=save_plot,
                           save_plot_kwargs=save_plot_kwargs, ret_df=True)
     if verbose:
         return data.sort_values('AbsDif', ascending=False)
@@ -1571,8 +1825,7 @@ def mad(data, test, decimals=2, sign='all', verbose=False):
         test: informs which base test to use for the mad.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
@@ -1601,8 +1854,7 @@ def mse(data, test, decimals=2, sign='all', verbose=False):
         test: informs which base test to use for the mad.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
@@ -1631,8 +1883,7 @@ def mad_summ(data, test, decimals=2, sign='all', verbose=False):
         test: informs which base test to use for the summation mad.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
@@ -1644,18 +1895,17 @@ def mad_summ(data, test, decimals=2, sign='all', verbose=False):
     test = _check_digs_(test)
 
     start = Source(data, sign=sign, decimals=decimals, verbose=verbose)
-    temp = start.loc[start.ZN >= 10 ** (test - 1)]
-    temp[digs_dict[test]] = (temp.ZN // 10 ** ((log10(temp.ZN).astype(
-                                                int)) - (test - 1))).astype(
-                                                    int)
+    col = digs_dict[test]
+    sums = digit_sums(extract_digits(start.ZN, [col])[col], test, start.ZN)
+    # only the digits found, as in the Summation test
+    sums = sums[sums > 0]
     li = 1. / (9 * (10 ** (test - 1)))
 
-    df = temp.groupby(digs_dict[test]).sum()
-    return mean(abs(df.ZN / df.ZN.sum() - li))
+    return mean(abs(sums / sums.sum() - li))
 
 
 def rolling_mad(data, test, window, decimals=2, sign='all',
-                show_plot=False, save_plot=None, save_plot_kwargs=None):
+                show_plot=False, save_plot=None, save_plot_kwargs=None, step=1):
     """Applies the MAD to sequential subsets of the records.
 
     Args:
@@ -1664,14 +1914,18 @@ def rolling_mad(data, test, window, decimals=2, sign='all',
             integers or floats.
         test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
             3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
-        window: size of the subset to be used.
+        window: size of the subset to be used: a number of records or, if
+            data is a Series with a sorted DatetimeIndex, a fixed duration,
+            such as '30D', for the records in the preceding 30 days.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
+        step: computes only every step-th window. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for one window ending at the
+            end of each period. Defaults to 1.
         show_plot: draws the test plot.
         save_plot: string with the path/name of the file in which the generated
             plot will be saved. Uses matplotlib.pyplot.savefig(). File format
@@ -1687,14 +1941,14 @@ def rolling_mad(data, test, window, decimals=2, sign='all',
         Series with sequentially computed MADs.
     """
     data = _check_num_array_(data)
-    r_mad = Roll_mad(data, test, window, decimals, sign)
+    r_mad = Roll_mad(data, test, window, decimals, sign, step=step)
     if show_plot:
         r_mad.show_plot(save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
     return r_mad.roll_series
 
 
 def rolling_mse(data, test, window, decimals=2, sign='all',
-                show_plot=False, save_plot=None, save_plot_kwargs=None):
+                show_plot=False, save_plot=None, save_plot_kwargs=None, step=1):
     """Applies the MSE to sequential subsets of the records.
 
     Args:
@@ -1703,14 +1957,18 @@ def rolling_mse(data, test, window, decimals=2, sign='all',
             integers or floats.
         test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
             3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
-        window: size of the subset to be used.
+        window: size of the subset to be used: a number of records or, if
+            data is a Series with a sorted DatetimeIndex, a fixed duration,
+            such as '30D', for the records in the preceding 30 days.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
+        step: computes only every step-th window. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for one window ending at the
+            end of each period. Defaults to 1.
         show_plot: draws the test plot.
         save_plot: string with the path/name of the file in which the generated
             plot will be saved. Uses matplotlib.pyplot.savefig(). File format
@@ -1726,12 +1984,107 @@ def rolling_mse(data, test, window, decimals=2, sign='all',
         Series with sequentially computed MSEs.
     """
     data = _check_num_array_(data)
-    r_mse = Roll_mse(data, test, window, decimals, sign)
+    r_mse = Roll_mse(data, test, window, decimals, sign, step=step)
     if show_plot:
         r_mse.show_plot(save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
     return r_mse.roll_series
 
 
+def expanding(data, test, stats=('N', 'MAD', 'chi2'), decimals=2, sign='all',
+              step=1, show_plot=False, save_plot=None, save_plot_kwargs=None):
+    """Applies tests' statistics to the growing subsets made of the first
+    records, up to every record or every step-th one.
+
+    Args:
+        data: sequence of numbers to be evaluated. Must be a numpy 1D array,
+            a pandas Series or a pandas DataFrame column, with values being
+            integers or floats.
+        test: tells which test to use. 1: Fisrt Digits; 2: First Two Digits;
+            3: First Three Digits; 22: Second Digit; and -2: Last Two Digits.
+        stats: list with the statistics to compute, among 'N' (the number of
+            records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to
+            ('N', 'MAD', 'chi2').
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+        step: computes only every step-th subset. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for the records up to the
+            end of each period. Defaults to 1.
+        show_plot: draws the MAD plot.
+        save_plot: string with the path/name of the file in which the generated
+            plot will be saved. Uses matplotlib.pyplot.savefig(). File format
+            is infered by the file name extension. Only available when
+            show_plot is True.
+        save_plot_kwargs: dict with any of the kwargs accepted by
+            matplotlib.pyplot.savefig()
+            https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
+            Only available when show_plot is True and save_plot is a string
+            with the figure file path/name.
+
+    Returns:
+        DataFrame with a column for each statistic and a row for each subset.
+    """
+    data = _check_num_array_(data)
+    exp = Expanding(data, test, stats, decimals, sign, step=step)
+    if show_plot:
+        exp.show_plot(save_plot=save_plot, save_plot_kwargs=save_plot_kwargs)
+    return exp.stats
+
+
+def rolling_tests(data, window, tests=None, stats=('MAD',), decimals=2,
+                  sign='all', step=1):
+    """Applies several tests' statistics to the same sequential subsets of
+    the records at once, extracting the digits a single time and sliding
+    over the records only once for all the tests.
+
+    Unlike rolling_mad and rolling_mse, whose windows take only the records
+    valid for their test, the windows here are the same for all the tests:
+    the records too small for a test are left out of that test's counts.
+
+    Args:
+        data: sequence of numbers to be evaluated. Must be a numpy 1D array,
+            a pandas Series or a pandas DataFrame column, with values being
+            integers or floats.
+        window: size of the subset to be used: a number of records or, if
+            data is a Series with a sorted DatetimeIndex, a fixed duration,
+            such as '30D', for the records in the preceding 30 days. If
+            None, each subset holds all the records up to its end.
+        tests: list with the tests to apply, by name (F1D, F2D, F3D, SD,
+            L2D) or number (1, 2, 3, 22, -2). Defaults to None, for all of
+            them.
+        stats: list with the statistics to compute, among 'N' (the number
+            of records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to ('MAD',).
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+        step: computes only every step-th window. With a DatetimeIndex, may
+            be a frequency string, such as 'ME', for one window ending at the
+            end of each period. Defaults to 1.
+
+    Returns:
+        DataFrame with a (test, statistic) column for each pair, such as
+            ('F1D', 'MAD'), and a row for each window.
+
+    Raises:
+        ValueError: if a statistic is not one of 'N', 'chi2', 'KS', 'MAD'
+            and 'MSE', or the window or step are not valid.
+    """
+    stats = _check_stats_(stats)
+    if tests is None:
+        tests = list(digs_dict)
+    cols = list(dict.fromkeys(digs_dict[_check_test_(t)] for t in tests))
+    data = Source(_check_num_array_(data), decimals=decimals, sign=sign,
+                  verbose=False)
+    digits = DataFrame(extract_digits(data.ZN, cols), index=data.index)
+    return rolling_tests_stats(digits[cols], window, stats, step)
+
+
 def duplicates(data, top_Rep=20, verbose=True, inform=None):
     """Performs a duplicates test and maps the duplicates count in descending
     order.
@@ -1782,6 +2135,11 @@ def second_order(data, test, decimals=2, sign='all', verbose=True, MAD=False,
     """Performs the chosen test after subtracting the ordered sequence by itself.
     Hence Second Order.
 
+    The returned DataFrame holds a row for each difference, so data must fit
+    in memory. For data larger than memory, such as a .npy or raw binary
+    file, use readers.read_npy or readers.read_raw with sec_order=True, the
+    only out of core paths for the Second Order tests.
+
     Args:
         data: sequence of numbers to be evaluated. Must be a numpy 1D array,
             a pandas Series or a pandas DataFrame column, with values being
@@ -1791,8 +2149,7 @@ def second_order(data, test, decimals=2, sign='all', verbose=True, MAD=False,
             Second Digits; -2 or 'L2D': Last Two Digits.
         decimals: number of decimal places to consider. Defaluts to 2.
             If integers, set to 0. If set to -infer-, it will remove the zeros
-            and consider up to the fifth decimal place to the right, but will
-            loose performance.
+            and consider up to the fifth decimal place to the right.
         sign: tells which portion of the data to consider. pos: only the positive
             entries; neg: only negative entries; all: all entries but zeros.
             Defaults to all.
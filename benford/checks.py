@@ -10,6 +10,7 @@ def _check_digs_(digs):
     if digs not in [1, 2, 3]:
         raise ValueError("The value assigned to the parameter -digs- "
                          f"was {digs}. Value must be 1, 2 or 3.")
+    return digs
 
 
 def _check_test_(test):
@@ -62,6 +63,18 @@ def _check_confidence_(confidence):
     return confidence
 
 
+def _check_stats_(stats):
+    """"""
+    stats = list(stats)
+    unknown = [stat for stat in stats
+               if stat not in ['N', 'chi2', 'KS', 'MAD', 'MSE']]
+    if unknown:
+        raise ValueError(f"Unknown statistics: {unknown}. Parameter -stats- "
+                         "must hold some of 'N', 'chi2', 'KS', 'MAD' and "
+                         "'MSE'.")
+    return stats
+
+
 def _check_high_Z_(high_Z):
     """"""
     if not high_Z in ['pos', 'all']:
@@ -0,0 +1,269 @@
+"""Command-line batch runner: runs the Benford tests over CSV, .npy and raw
+binary files, or directories of them, and writes one record per file,
+column and test, as JSON lines or CSV.
+
+    benford data/SPY.csv -c Open,Close --decimals infer --format csv
+"""
+import sys
+import json
+import csv
+from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import ProcessPoolExecutor
+from os import listdir, makedirs
+from os.path import isdir, join, splitext, basename, abspath
+from math import isfinite
+from time import perf_counter
+from .constants import digs_dict, confs
+from .checks import _check_test_
+from .accumulator import BenfordAccumulator
+from .readers import read_csv, read_npy, read_raw, WINDOW, CHUNKSIZE
+
+
+# File extensions handled, and the dtype of the raw binary ones
+RAW_EXTENSIONS = {'.i8': 'int64', '.f8': 'float64'}
+EXTENSIONS = ['.csv', '.npy'] + list(RAW_EXTENSIONS)
+
+FIELDS = ['file', 'column', 'test', 'N', 'discarded', 'chi2', 'chi2_crit',
+          'KS', 'KS_crit', 'MAD', 'MSE']
+
+
+def _decimals_value_(value):
+    """An int or 'infer'"""
+    value = value.strip()
+    if value == 'infer':
+        return value
+    try:
+        value = int(value)
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise ArgumentTypeError(f"invalid decimals: '{value}', must be an "
+                                "int >= 0 or 'infer'")
+    return value
+
+
+def _parse_decimals_(value):
+    """argparse type for --decimals: comma-separated ints or 'infer', for
+    all the columns, or col=value, for a single CSV column. Returns a dict
+    by column, with None for the default, which is 2 if not given.
+    """
+    decimals = {None: 2}
+    for item in value.split(','):
+        col, sep, dec = item.rpartition('=')
+        decimals[col.strip() if sep else None] = _decimals_value_(dec)
+    return decimals
+
+
+def _parse_test_(value):
+    """A test given by name (F1D) or number (1)"""
+    value = value.strip()
+    try:
+        value = int(value)
+    except ValueError:
+        pass
+    return _check_test_(value)
+
+
+def _parse_tests_(value):
+    """argparse type for --tests: comma-separated tests"""
+    try:
+        return [_parse_test_(t) for t in value.split(',')]
+    except ValueError:
+        raise ArgumentTypeError(f"invalid tests: '{value}', must be among "
+                                f"{','.join(digs_dict.values())} or "
+                                f"{','.join(map(str, digs_dict))}")
+
+
+def _parser_():
+    """Command-line arguments"""
+    parser = ArgumentParser(prog='benford', description="Runs Benford's Law "
+                            "tests over CSV (.csv), numpy (.npy) and raw "
+                            "little-endian int64 (.i8) or float64 (.f8) "
+                            "files, or directories with them.")
+    parser.add_argument('paths', nargs='+', help='files or directories')
+    parser.add_argument('-c', '--columns', default=None,
+                        help='comma-separated columns of the CSV files to '
+                        'analyse. Defaults to all the numeric ones.')
+    parser.add_argument('-t', '--tests', type=_parse_tests_,
+                        default=','.join(digs_dict.values()),
+                        help='comma-separated tests to run. Defaults to '
+                        'F1D,F2D,F3D,SD,L2D.')
+    parser.add_argument('-d', '--decimals', type=_parse_decimals_,
+                        default='2', help="decimal places to consider, or "
+                        "'infer', for the float columns, or col=value for "
+                        "a single CSV column, comma-separated, such as "
+                        "'infer,Volume=0'. Integer columns ignore it. "
+                        'Defaults to 2.')
+    parser.add_argument('-s', '--sign', choices=['all', 'pos', 'neg'],
+                        default='all', help='Defaults to all.')
+    parser.add_argument('--confidence', type=float, default=95,
+                        help='Defaults to 95.')
+    parser.add_argument('--limit-N', type=int, default=None)
+    parser.add_argument('-f', '--format', choices=['jsonl', 'csv'],
+                        default='jsonl', help='Defaults to jsonl.')
+    parser.add_argument('-o', '--output', default=None,
+                        help='output file. Defaults to the standard output.')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes. Defaults to the '
+                        'number of CPUs.')
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE,
+                        help='CSV rows parsed at a time.')
+    parser.add_argument('--window', type=int, default=WINDOW,
+                        help='binary records processed at a time.')
+    parser.add_argument('--plots', default=None, metavar='DIR',
+                        help='saves the plot of each test as a PNG in DIR.')
+    return parser
+
+
+def _list_files_(paths):
+    """Expands the directories into the files they hold with the handled
+    extensions.
+    """
+    files = []
+    for path in paths:
+        if isdir(path):
+            files += [join(path, name) for name in sorted(listdir(path))
+                      if splitext(name)[1].lower() in EXTENSIONS]
+        else:
+            files.append(path)
+    return files
+
+
+def _csv_columns_(path, columns):
+    """The chosen columns, or the numeric ones, guessed from the first rows
+    """
+    if columns is not None:
+        return columns
+    from pandas import read_csv as pd_read_csv
+    return list(pd_read_csv(path, nrows=1000).select_dtypes('number').columns)
+
+
+def _run_file_(path, columns, kwargs, chunksize, window):
+    """Worker job: the serialized accumulators of a file's columns, and the
+    number of rows and seconds it took.
+    """
+    start = perf_counter()
+    ext = splitext(path)[1].lower()
+    kwargs = dict(kwargs)
+    decimals = kwargs.pop('decimals')
+    if ext == '.csv':
+        columns = _csv_columns_(path, columns)
+        accs = read_csv(path, columns, chunksize=chunksize,
+                        decimals={col: decimals.get(col, decimals[None])
+                                  for col in columns}, **kwargs)
+    elif ext == '.npy':
+        accs = {None: read_npy(path, window=window,
+                               decimals=decimals[None], **kwargs)}
+    elif ext in RAW_EXTENSIONS:
+        accs = {None: read_raw(path, RAW_EXTENSIONS[ext], window=window,
+                               decimals=decimals[None], **kwargs)}
+    else:
+        raise ValueError(f'Unknown file extension: {ext}')
+    rows = max([acc.n_seen for acc in accs.values()], default=0)
+    return ({col: acc.to_bytes() for col, acc in accs.items()}, rows,
+            perf_counter() - start)
+
+
+def _float_(value):
+    """A float, or None for the missing and the non-finite values, which
+    JSON cannot hold
+    """
+    if value is None:
+        return None
+    value = float(value)
+    return value if isfinite(value) else None
+
+
+def _records_(path, col, acc, tests):
+    """One output record for each test of a column"""
+    for digs in tests:
+        test = acc.test(digs)
+        crit = test.critical_values if test.confidence is not None else {}
+        yield test, {'file': path, 'column': col, 'test': digs_dict[digs],
+                     'N': int(test.N),
+                     'discarded': acc.discarded[digs_dict[digs]],
+                     'chi2': _float_(test.chi_square),
+                     'chi2_crit': _float_(crit.get('chi2')),
+                     'KS': _float_(test.KS),
+                     'KS_crit': _float_(crit.get('KS')),
+                     'MAD': _float_(test.MAD), 'MSE': _float_(test.MSE)}
+
+
+def _save_plot_(test, plots, path, col):
+    """Saves the test plot in the plots directory, with a non-interactive
+    backend.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    name = '_'.join(str(part) for part in [splitext(basename(path))[0], col,
+                                           test.name.replace(' ', '_')]
+                    if part is not None)
+    test.show_plot(save_plot=join(plots, f'{name}.png'))
+    plt.close('all')
+
+
+def main(argv=None):
+    """Entry point of the benford console script.
+
+    Returns:
+        0 if all the files were analysed, 1 otherwise.
+    """
+    args = _parser_().parse_args(argv)
+    tests = args.tests
+    confidence = args.confidence
+    if confidence == int(confidence):
+        confidence = int(confidence)
+    if confidence not in confs:
+        raise SystemExit(f'--confidence must be one of {list(confs)[1:]}')
+    kwargs = {'decimals': args.decimals, 'sign': args.sign,
+              'confidence': confidence, 'limit_N': args.limit_N}
+    columns = None if args.columns is None else [
+        c.strip() for c in args.columns.split(',')]
+    if args.plots is not None:
+        makedirs(args.plots, exist_ok=True)
+
+    out = sys.stdout if args.output is None else open(args.output, 'w',
+                                                      newline='')
+    if args.format == 'csv':
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(record):
+            out.write(json.dumps(record, allow_nan=False) + '\n')
+
+    status = 0
+    files = _list_files_(args.paths)
+    if args.output is not None:
+        # a CSV output written next to the inputs is not one of them
+        files = [f for f in files if abspath(f) != abspath(args.output)]
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            futures = [ex.submit(_run_file_, path, columns, kwargs,
+                                 args.chunksize, args.window)
+                       for path in files]
+            for path, fut in zip(files, futures):
+                try:
+                    accs, rows, secs = fut.result()
+                except Exception as err:
+                    print(f'{path}: {err}', file=sys.stderr)
+                    status = 1
+                    continue
+                for col, buffer in accs.items():
+                    acc = BenfordAccumulator.from_bytes(buffer)
+                    for test, record in _records_(path, col, acc, tests):
+                        write(record)
+                        if args.plots is not None:
+                            _save_plot_(test, args.plots, path, col)
+                print(f'{path}: {rows} rows in {secs:.2f}s '
+                      f'({rows / max(secs, 1e-9):,.0f} rows/s)',
+                      file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
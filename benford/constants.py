@@ -4,6 +4,10 @@ sec_order_dict = {key: f'{val}_sec' for key, val in digs_dict.items()}
 
 rev_digs = {'F1D': 1, 'F2D': 2, 'F3D': 3, 'SD': 22, 'L2D': -2}
 
+# Smallest dtypes holding each test's digits (and their discard sentinel)
+compact_dtypes = {'F1D': 'uint8', 'F2D': 'uint8', 'F3D': 'uint16',
+                  'SD': 'uint8', 'L2D': 'uint8'}
+
 names = {'F1D': 'First Digit Test', 'F2D': 'First Two Digits Test',
          'F3D': 'First Three Digits Test', 'SD': 'Second Digit Test',
          'L2D': 'Last Two Digits Test',
@@ -1,7 +1,10 @@
-from pandas import DataFrame
+from pandas import DataFrame, Index
 from numpy import array, arange, log10
 from .checks import _check_digs_
-from .viz import plot_expected
+
+
+# Read-only expected proportions and digits of each test, filled on first use
+_EXPECTED_ = {}
 
 
 class First(DataFrame):
@@ -27,14 +30,11 @@ class First(DataFrame):
 
     def __init__(self, digs, plot=True, save_plot=None, save_plot_kwargs=None):
         _check_digs_(digs)
-        dig_name = f'First_{digs}_Dig'
-        Dig = arange(10 ** (digs - 1), 10 ** digs)
-        Exp = log10(1 + (1. / Dig))
-
-        DataFrame.__init__(self, {'Expected': Exp}, index=Dig)
-        self.index.names = [dig_name]
+        DataFrame.__init__(self, {'Expected': _expected_(digs)[0]},
+                           index=_index_(digs))
 
         if plot:
+            from .viz import plot_expected
             plot_expected(self, digs, save_plot=save_plot,
                           save_plot_kwargs=save_plot_kwargs)
 
@@ -57,15 +57,11 @@ class Second(DataFrame):
             figure file path/name.
     """
     def __init__(self, plot=True, save_plot=None, save_plot_kwargs=None):
-        a = arange(10, 100)
-        Expe = log10(1 + (1. / a))
-        Sec_Dig = array(list(range(10)) * 9)
-
-        df = DataFrame({'Expected': Expe, 'Sec_Dig': Sec_Dig})
-
-        DataFrame.__init__(self, df.groupby('Sec_Dig').sum())
+        DataFrame.__init__(self, {'Expected': _expected_(22)[0]},
+                           index=_index_(22))
 
         if plot:
+            from .viz import plot_expected
             plot_expected(self, 22, save_plot=save_plot,
                           save_plot_kwargs=save_plot_kwargs)
 
@@ -88,15 +84,64 @@ class LastTwo(DataFrame):
             figure file path/name.
     """
     def __init__(self, num=False, plot=True, save_plot=None, save_plot_kwargs=None):
-        exp = array([1 / 99.] * 100)
-        DataFrame.__init__(self, {'Expected': exp,
-                                  'Last_2_Dig': _lt_(num=num)})
-        self.set_index('Last_2_Dig', inplace=True)
+        if num:
+            index = _index_(-2)
+        else:
+            index = Index(_lt_(), name='Last_2_Dig')
+        DataFrame.__init__(self, {'Expected': _expected_(-2)[0]}, index=index)
         if plot:
+            from .viz import plot_expected
             plot_expected(self, -2, save_plot=save_plot,
                           save_plot_kwargs=save_plot_kwargs)
 
 
+def _expected_(digs):
+    """Gives the expected proportions of a test and the digits they refer
+    to, computed on the first call and then cached, as read-only arrays, so
+    they can be shared without copies.
+
+    Args:
+        digs: the test: 1, 2, 3, 22 or -2.
+
+    Returns:
+        Tuple with the arrays of the expected proportions and of the digits.
+    """
+    try:
+        return _EXPECTED_[digs]
+    except KeyError:
+        pass
+    if digs in [1, 2, 3]:
+        ind = arange(10 ** (digs - 1), 10 ** digs)
+        exp = log10(1 + (1. / ind))
+    elif digs == 22:
+        # the second digit proportions add up those of the first two digits
+        # ending in it, with the (compensated) sums of a groupby
+        ind = arange(0, 10)
+        temp = DataFrame({'Expected': log10(1 + (1. / arange(10, 100))),
+                          'Sec_Dig': array(list(range(10)) * 9)})
+        exp = temp.groupby('Sec_Dig').Expected.sum().to_numpy()
+    elif digs == -2:
+        ind = arange(0, 100)
+        exp = array([1 / 99.] * 100)
+    else:
+        raise ValueError(f'Unknown test: {digs}.')
+    exp.flags.writeable = False
+    ind.flags.writeable = False
+    _EXPECTED_[digs] = (exp, ind)
+    return exp, ind
+
+
+def _index_(digs):
+    """Builds the (numeric) index of a test's Expected DataFrame"""
+    if digs == 22:
+        name = 'Sec_Dig'
+    elif digs == -2:
+        name = 'Last_2_Dig'
+    else:
+        name = f'First_{digs}_Dig'
+    return Index(_expected_(digs)[1], name=name)
+
+
 def _test_(digs):
     """Chooses the Exxpected class to be used in a test
 
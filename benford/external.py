@@ -0,0 +1,145 @@
+"""External (out-of-core) sort for the Second Order tests, which need the
+whole sequence sorted: the records are sorted in fixed-size runs, each
+written to a temporary file, and the runs are merged back block by block,
+so memory depends on the run and block sizes, not on the number of
+records.
+"""
+from os.path import join
+from tempfile import TemporaryDirectory
+from numpy import array, asarray, concatenate, diff, float64, inf, isnan, \
+    load, save
+from .utils import _sign_mask_
+
+
+# Number of records sorted at a time, in memory (128 MB of float64)
+RUN_SIZE = 2 ** 24
+# Number of records buffered from all the runs together while merging
+BLOCK = 2 ** 20
+
+
+def _sorted_run_(arr, sign=None):
+    """A copy of the records, as float64, sorted in place, with the NaNs and
+    the records not of the chosen sign, if given, left out.
+    """
+    run = array(arr, dtype=float64)
+    run = run[~isnan(run) if sign is None else _sign_mask_(run, sign)]
+    run.sort()
+    return run
+
+
+def sorted_runs(arr, tmpdir, run_size=RUN_SIZE, sign=None):
+    """Sorts the records in runs of run_size records, each saved as a .npy
+    file in tmpdir.
+
+    Args:
+        arr: numpy 1D array or memmap of integers or floats.
+        tmpdir: path of the directory to write the runs in.
+        run_size: number of records per run. Defaults to RUN_SIZE.
+        sign: if given, 'all', 'pos' or 'neg', to keep only the records of
+            that sign. Defaults to None, for all of them but the NaNs.
+
+    Returns:
+        List with the paths of the runs' files.
+    """
+    paths = []
+    for start in range(0, len(arr), run_size):
+        path = join(tmpdir, f'run_{len(paths)}.npy')
+        save(path, _sorted_run_(arr[start:start + run_size], sign))
+        paths.append(path)
+    return paths
+
+
+def merge_runs(runs, block=BLOCK):
+    """Merges sorted runs, reading an equal share of block records from each
+    at a time. All the buffered records up to the smallest of the last
+    buffered records of the runs not fully read can be output, since no
+    record still to be read is smaller, so each step outputs a sorted array
+    of up to block records.
+
+    Args:
+        runs: list of sorted 1D arrays, typically memmaps of the runs'
+            files.
+        block: number of records buffered from all the runs together.
+            Defaults to BLOCK.
+
+    Yields:
+        Sorted 1D arrays which, put together, hold all the records in order.
+    """
+    share = max(1, block // max(len(runs), 1))
+    pos = [0] * len(runs)
+    bufs = [runs[i][:0] for i in range(len(runs))]
+    while True:
+        for i, run in enumerate(runs):
+            if not len(bufs[i]) and pos[i] < len(run):
+                bufs[i] = array(run[pos[i]:pos[i] + share])
+                pos[i] += len(bufs[i])
+        live = [i for i in range(len(runs)) if len(bufs[i])]
+        if not live:
+            return
+        bound = min([bufs[i][-1] for i in live if pos[i] < len(runs[i])],
+                    default=inf)
+        parts = []
+        for i in live:
+            take = bufs[i].searchsorted(bound, side='right')
+            parts.append(bufs[i][:take])
+            bufs[i] = bufs[i][take:]
+        merged = concatenate(parts)
+        merged.sort()
+        yield merged
+
+
+def _diffs_(chunks):
+    """The nonzero differences of consecutive records of sorted chunks, the
+    last record of each chunk carried on to the next one.
+    """
+    last = None
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        diffs = diff(chunk, prepend=chunk[:1] if last is None else last)
+        last = chunk[-1:]
+        diffs = diffs[diffs != 0]
+        if len(diffs):
+            yield diffs
+
+
+def external_sorted_diffs(arr, run_size=RUN_SIZE, block=BLOCK, sign=None,
+                          tmpdir=None):
+    """Subtracts the sorted sequence elements from each other, discarding
+    zeros, as utils.sorted_diffs, for sequences too large to be sorted in
+    memory, such as memory-mapped files: the records are sorted in runs
+    saved to temporary files, which are merged, with the differences taken
+    on the fly. A sequence that fits in a single run is sorted in memory.
+
+    Args:
+        arr: numpy 1D array or memmap of integers or floats.
+        run_size: number of records sorted at a time. Defaults to RUN_SIZE.
+        block: number of records buffered from all the runs together while
+            merging. Defaults to BLOCK.
+        sign: if given, 'all', 'pos' or 'neg', to keep only the records of
+            that sign before sorting. Defaults to None, for all of them but
+            the NaNs.
+        tmpdir: directory in which to create the temporary one with the
+            runs. Defaults to None, for the system's default.
+
+    Yields:
+        1D float64 arrays with the nonzero differences, in ascending order
+            of the records.
+
+    Raises:
+        ValueError: if run_size or block are not positive.
+    """
+    if run_size < 1 or block < 1:
+        raise ValueError('run_size and block must be positive integers.')
+    arr = asarray(arr)
+    if len(arr) <= run_size:
+        yield from _diffs_([_sorted_run_(arr, sign)])
+        return
+    with TemporaryDirectory(dir=tmpdir) as tmp:
+        runs = [load(path, mmap_mode='r')
+                for path in sorted_runs(arr, tmp, run_size, sign)]
+        try:
+            yield from _diffs_(merge_runs(runs, block))
+        finally:
+            # the memory maps are closed before the files are removed
+            del runs
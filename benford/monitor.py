@@ -0,0 +1,330 @@
+from collections import namedtuple
+from numpy import zeros, full, arange, float64, bincount, errstate, nan, inf
+from pandas import Series
+from .constants import digs_dict, mad_dict, crit_chi2, KS_crit
+from .checks import _check_decimals_, _check_sign_, _check_test_, \
+    _check_confidence_
+from .expected import _expected_, _index_
+from .stats import tests_by_row
+from .utils import scale_records, extract_digits, _bins_
+
+
+class EWMAMonitor(object):
+    """Follows the digits profile of a stream of records, weighting them
+    with exponentially decaying weights, so that the recent activity counts
+    more than the old one, without keeping any record: the weight of a
+    record halves every half_life records received after it. Each batch
+    costs one pass over its records and one over the test's bins, and the
+    state is only the weighted counts and two floats, so that millions of
+    monitors (by account, vendor...) can be kept at once.
+
+    The statistics take the effective sample size (the squared sum of the
+    weights over the sum of their squares) as N, which is about 2.9 times
+    the half-life once the stream is long enough.
+
+    Args:
+        test: the test to follow: 1 or 'F1D', 2 or 'F2D', 3 or 'F3D', 22 or
+            'SD', -2 or 'L2D'. Defaults to 'F1D'.
+        half_life: number of records after which a record weighs half. May
+            be inf, for no decay. Defaults to 10000.
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+
+    Attributes:
+        counts: 1D array with the weighted counts of the test's digits
+        sum_sq: sum of the squared weights of the records
+        n_seen (int): number of records counted so far, the ones discarded
+            from the test left out
+
+    Raises:
+        ValueError: if half_life is not positive.
+    """
+
+    __slots__ = ['digs', 'decimals', 'sign', 'half_life', 'decay', 'counts',
+                 'sum_sq', 'n_seen']
+
+    def __init__(self, test='F1D', half_life=10000, decimals=2, sign='all'):
+        self.digs = _check_test_(test)
+        self.decimals = _check_decimals_(decimals)
+        self.sign = _check_sign_(sign)
+        if not half_life > 0:
+            raise ValueError('half_life must be a positive number of records.')
+        self.half_life = half_life
+        #: weight kept by the older records at each new one
+        self.decay = 0.5 ** (1 / half_life)
+        lo, hi = _bins_(self.digs)
+        self.counts = zeros(hi - lo, dtype=float64)
+        self.sum_sq = 0.
+        self.n_seen = 0
+
+    def update(self, chunk):
+        """Adds a batch of records, in the order they arrived, decaying the
+        weights of the records received before.
+
+        Args:
+            chunk: numpy 1D array or pandas Series of integers or floats.
+
+        Returns:
+            The monitor itself, so that calls can be chained.
+        """
+        col = digs_dict[self.digs]
+        _, ZN = scale_records(chunk, self.decimals, self.sign)
+        return self.update_digits(extract_digits(ZN, [col])[col])
+
+    def update_digits(self, digits):
+        """Adds a batch of records given by their digits, as extracted by
+        utils.extract_digits, so that several monitors can share a single
+        extraction.
+
+        Args:
+            digits: 1D int array with the test's digits of the records, in
+                the order they arrived, the discarded ones included.
+
+        Returns:
+            The monitor itself.
+        """
+        lo, hi = _bins_(self.digs)
+        digits = digits[(digits >= lo) & (digits < hi)]
+        m = len(digits)
+        if m == 0:
+            return self
+        # the last record weighs 1, the one before decay, and so on
+        weights = self.decay ** arange(m - 1, -1, -1, dtype=float64)
+        self.counts *= self.decay ** m
+        self.counts += bincount(digits - lo, weights=weights,
+                                minlength=hi - lo)
+        self.sum_sq = self.sum_sq * self.decay ** (2 * m) + \
+            (weights ** 2).sum()
+        self.n_seen += m
+        return self
+
+    @property
+    def N(self):
+        """float: effective sample size of the weighted counts."""
+        if self.sum_sq == 0:
+            return 0.
+        return self.counts.sum() ** 2 / self.sum_sq
+
+    def _found_(self):
+        """Array with the weighted proportions of each digit"""
+        total = self.counts.sum()
+        return self.counts / total if total else self.counts
+
+    @property
+    def proportions(self):
+        """Series with the weighted proportions of each digit."""
+        return Series(self._found_(), index=_index_(self.digs), name='Found')
+
+    def _stats_(self, stats=None, N=None):
+        """The statistics as floats, and the Z scores as an array, with no
+        pandas object built, for the checks after each batch.
+        """
+        if N is None:
+            N = self.N
+        # the proportions scaled to the effective sample size
+        found = self._found_() * N
+        with errstate(divide='ignore', invalid='ignore'):
+            res = tests_by_row(found.reshape(1, -1), _expected_(self.digs)[0],
+                               N=full(1, N), stats=stats)
+        for stat, vals in res.items():
+            vals = vals[0] if N else full(vals[0].shape, nan)
+            res[stat] = vals if stat == 'Z_score' else float(vals)
+        return res
+
+    def stats(self, stats=None):
+        """Computes the tests' statistics of the current weighted profile.
+
+        Args:
+            stats: list with the statistics to compute, among 'chi2', 'KS',
+                'MAD', 'MSE' and 'Z_score'. Defaults to None, for all of
+                them.
+
+        Returns:
+            Dict with the floats 'chi2', 'KS', 'MAD' and 'MSE' and the
+                Series 'Z_score', or those of them in stats, all NaN before
+                any record is counted.
+        """
+        res = self._stats_(stats)
+        if 'Z_score' in res:
+            res['Z_score'] = Series(res['Z_score'], index=_index_(self.digs),
+                                    name='Z_score')
+        return res
+
+    @property
+    def MAD(self):
+        """float: Mean Absolute Deviation of the weighted profile."""
+        return self.stats(['MAD'])['MAD']
+
+    @property
+    def chi_square(self):
+        """float: chi-square statistic, with the effective sample size."""
+        return self.stats(['chi2'])['chi2']
+
+    @property
+    def Z_score(self):
+        """Series with the Z scores of each digit."""
+        return self.stats(['Z_score'])['Z_score']
+
+
+#: A threshold crossing reported by a DriftMonitor: the test and statistic,
+#: their value and threshold, the (effective) sample size, the number of
+#: records received so far and whether the alarm was raised or cleared.
+DriftEvent = namedtuple('DriftEvent', ['test', 'stat', 'value', 'threshold',
+                                       'N', 'n_seen', 'alarm'])
+
+
+class DriftMonitor(object):
+    """Watches a stream of records for departures from Benford's Law, to
+    raise alarms as soon as the stream stops conforming. It keeps running
+    counts of the digits of each test, fed in micro-batches of any size, and
+    checks after each batch the MAD against the nonconformity limit of
+    mad_dict, and the chi-square and Kolmogorov-Smirnov statistics against
+    their critical values at the confidence level. The work per batch is
+    one pass over its records and one over the tests' bins, whatever the
+    number of records seen before.
+
+    An alarm is raised, and the callbacks called with a DriftEvent, when a
+    statistic goes above its threshold, and cleared, with another event,
+    only when it goes back below the threshold minus the hysteresis margin,
+    so that a statistic wavering around its threshold does not fire at
+    every batch. No statistic is checked before the test has min_N records.
+
+    Args:
+        tests: list with the tests to follow, by name (F1D, F2D, F3D, SD,
+            L2D) or number (1, 2, 3, 22, -2). Defaults to ('F1D',).
+        stats: list with the statistics to check, among 'MAD', 'chi2' and
+            'KS'. The Last Two Digits test has no MAD limit. Defaults to
+            ('MAD', 'chi2', 'KS').
+        decimals: number of decimal places to consider. Defaluts to 2.
+            If integers, set to 0. If set to -infer-, it will remove the zeros
+            and consider up to the fifth decimal place to the right.
+        sign: tells which portion of the data to consider. pos: only the positive
+            entries; neg: only negative entries; all: all entries but zeros.
+            Defaults to all.
+        confidence: confidence level of the chi-square and KS critical
+            values. If None, only the MAD is checked. Defaults to 95.
+        min_N: number of records a test needs before being checked.
+            Defaults to 1000.
+        hysteresis: fraction of the threshold the statistic must go below to
+            clear an alarm. Defaults to 0.1.
+        half_life: if given, the counts decay as in EWMAMonitor, so that the
+            checks follow the recent records. Defaults to inf, for plain
+            running counts.
+        callbacks: list with the functions to call with each DriftEvent.
+            Defaults to None.
+
+    Attributes:
+        monitors (dict): the EWMAMonitor of each test, by test name
+        alarms (dict): whether the alarm of each (test, statistic) is raised
+        n_seen (int): number of records received so far
+
+    Raises:
+        ValueError: if a statistic is not one of 'MAD', 'chi2' and 'KS', or
+            hysteresis is not between 0 and 1.
+    """
+
+    def __init__(self, tests=('F1D',), stats=('MAD', 'chi2', 'KS'),
+                 decimals=2, sign='all', confidence=95, min_N=1000,
+                 hysteresis=0.1, half_life=inf, callbacks=None):
+        unknown = [stat for stat in stats if stat not in ['MAD', 'chi2', 'KS']]
+        if unknown:
+            raise ValueError(f"Unknown statistics: {unknown}. Parameter "
+                             "-stats- must hold some of 'MAD', 'chi2' and "
+                             "'KS'.")
+        if not 0 <= hysteresis < 1:
+            raise ValueError('hysteresis must be between 0 and 1.')
+        self.decimals = _check_decimals_(decimals)
+        self.sign = _check_sign_(sign)
+        self.confidence = _check_confidence_(confidence)
+        self.min_N = min_N
+        self.hysteresis = hysteresis
+        self.callbacks = list(callbacks or [])
+        self.monitors = {}
+        for test in tests:
+            digs = _check_test_(test)
+            self.monitors[digs_dict[digs]] = EWMAMonitor(
+                digs, half_life, self.decimals, self.sign)
+        self.stats = [stat for stat in stats
+                      if stat == 'MAD' or self.confidence is not None]
+        self.alarms = {(col, stat): False for col, mon in self.monitors.items()
+                       for stat in self.stats
+                       if stat != 'MAD' or mad_dict[mon.digs] is not None}
+        self.n_seen = 0
+
+    def add_callback(self, func):
+        """Adds a function to call with each DriftEvent.
+
+        Args:
+            func: callable taking a DriftEvent.
+        """
+        self.callbacks.append(func)
+
+    def thresholds(self, test):
+        """The current thresholds of a test's statistics.
+
+        Args:
+            test: the test, by name or number.
+
+        Returns:
+            Dict with the threshold of each statistic checked. The KS one
+                depends on the current sample size.
+        """
+        col = digs_dict[_check_test_(test)]
+        return self._thresholds_(col, self.monitors[col].N)
+
+    def _thresholds_(self, col, N):
+        """The thresholds of a test's statistics, for a sample size N"""
+        mon = self.monitors[col]
+        res = {}
+        for stat in self.stats:
+            if (col, stat) not in self.alarms:
+                continue
+            if stat == 'MAD':
+                res[stat] = mad_dict[mon.digs][2]
+            elif stat == 'chi2':
+                res[stat] = crit_chi2[len(mon.counts) - 1][self.confidence]
+            else:
+                res[stat] = KS_crit[self.confidence] / N ** 0.5 if N else nan
+        return res
+
+    def update(self, chunk):
+        """Adds a micro-batch of records, in the order they arrived, and
+        checks the thresholds of the tests with enough records.
+
+        Args:
+            chunk: numpy 1D array or pandas Series of integers or floats.
+
+        Returns:
+            List with the DriftEvents fired by the batch, each of them also
+                passed to the callbacks.
+        """
+        _, ZN = scale_records(chunk, self.decimals, self.sign)
+        digits = extract_digits(ZN, list(self.monitors))
+        self.n_seen += len(chunk)
+        events = []
+        for col, mon in self.monitors.items():
+            mon.update_digits(digits[col])
+            if mon.n_seen < self.min_N:
+                continue
+            N = mon.N
+            values = mon._stats_(self.stats, N)
+            for stat, threshold in self._thresholds_(col, N).items():
+                value = values[stat]
+                raised = self.alarms[col, stat]
+                if not raised and value > threshold:
+                    self.alarms[col, stat] = True
+                elif raised and value <= threshold * (1 - self.hysteresis):
+                    self.alarms[col, stat] = False
+                else:
+                    continue
+                events.append(DriftEvent(col, stat, value, float(threshold),
+                                         float(N), self.n_seen,
+                                         self.alarms[col, stat]))
+        for event in events:
+            for func in self.callbacks:
+                func(event)
+        return events
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from pandas import DataFrame, Index, factorize
+from numpy import asarray, bincount, minimum, maximum, errstate, int64
+from .constants import digs_dict
+from .checks import _check_confidence_, _check_decimals_, _check_sign_, \
+    _check_test_
+from .expected import _expected_, _index_
+from .stats import tests_by_row
+from .utils import scale_records, extract_digits, _sign_mask_, _bins_
+from .accumulator import BenfordAccumulator
+
+
+def _accumulate_column_(arr, decimals, sign):
+    """Worker job: the aggregates of a single column, returned as bytes so
+    only some KB travel back from a process pool.
+    """
+    return BenfordAccumulator(decimals=decimals, sign=sign).update(
+        arr).to_bytes()
+
+
+def analyze_columns(frame, columns=None, decimals=2, sign='all',
+                    confidence=95, limit_N=None, workers=None,
+                    executor='thread'):
+    """Runs the Benford tests on several columns of a DataFrame at once,
+    spreading the columns over a pool of workers. Each column is sent to
+    its worker once, as a numpy array, and only the digits histograms come
+    back, from which the tests are built.
+
+    Args:
+        frame: pandas DataFrame with the columns to analyse.
+        columns: list with the names of the columns. Defaults to None, in
+            which case all the numeric columns are used.
+        decimals: number of decimal places to consider, or 'infer', for all
+            the columns, or a dict with it by column name. Defaults to 2.
+        sign: tells which portion of the data to consider. pos: only the
+            positive entries; neg: only negative entries; all: all entries
+            but zeros. Defaults to all.
+        confidence: confidence level of the tests. Defaults to 95.
+        limit_N: sets a limit to N as the sample size for the calculation of
+            the Z scores if the sample is too big. Defaults to None.
+        workers: maximum number of workers. Defaults to None, in which case
+            the executor's default is used.
+        executor: 'thread' for a thread pool, since most of the work is done
+            by numpy, which releases the GIL, or 'process' for a process
+            pool. Defaults to 'thread'.
+
+    Returns:
+        Tuple with a summary DataFrame, indexed by column and test and with
+            the N, chi-square, KS, MAD and MSE of each test as columns, and a
+            dict with a dict of the Test objects by test name for each column.
+
+    Raises:
+        ValueError: if executor is not 'thread' nor 'process'.
+    """
+    if executor not in ['thread', 'process']:
+        raise ValueError("Parameter -executor- must be 'thread' or "
+                         "'process'.")
+    if columns is None:
+        columns = list(frame.select_dtypes('number').columns)
+    if not isinstance(decimals, dict):
+        decimals = {col: decimals for col in columns}
+    decimals = {col: _check_decimals_(decimals[col]) for col in columns}
+    sign = _check_sign_(sign)
+    confidence = _check_confidence_(confidence)
+
+    if executor == 'thread':
+        pool = ThreadPoolExecutor
+    else:
+        # imported here, since it loads multiprocessing
+        from concurrent.futures import ProcessPoolExecutor as pool
+    with pool(max_workers=workers) as ex:
+        futures = [ex.submit(_accumulate_column_, frame[col].to_numpy(),
+                             decimals[col], sign) for col in columns]
+        results = [fut.result() for fut in futures]
+
+    tests = {}
+    rows = []
+    for col, res in zip(columns, results):
+        acc = BenfordAccumulator.from_bytes(res)
+        acc.update_confidence(confidence)
+        acc.limit_N = limit_N
+        tests[col] = {}
+        for test in digs_dict.values():
+            tests[col][test] = t = acc.test(test)
+            rows.append((col, test, t.N, t.chi_square, t.KS, t.MAD, t.MSE))
+    summary = DataFrame(rows, columns=['column', 'test', 'N', 'chi2', 'KS',
+                                       'MAD', 'MSE']
+                        ).set_index(['column', 'test'])
+    return summary, tests
+
+
+def analyze_groups(frame, column, by, test='F1D', decimals=2, sign='all',
+                   limit_N=None, Z_scores=False):
+    """Runs a Benford test on the records of each group of a DataFrame (by
+    vendor, cost centre, employee...) at once: the digits of all the groups
+    are counted with a single bincount into a (group x digit) matrix, from
+    which the statistics of every group are computed as array operations.
+
+    Args:
+        frame: pandas DataFrame with the values and the group keys.
+        column: name of the column with the values to analyse.
+        by: name of the column with the group keys.
+        test: the test to run: 1 or 'F1D', 2 or 'F2D', 3 or 'F3D', 22 or
+            'SD', -2 or 'L2D'. Defaults to 'F1D'.
+        decimals: number of decimal places to consider, or 'infer'.
+            Defaults to 2.
+        sign: tells which portion of the data to consider. pos: only the
+            positive entries; neg: only negative entries; all: all entries
+            but zeros. Defaults to all.
+        limit_N: sets a limit to N as the sample size for the calculation of
+            the Z scores if the sample is too big. Defaults to None.
+        Z_scores: also returns the Z scores of each digit for every group.
+            Defaults to False.
+
+    Returns:
+        DataFrame indexed by group, with the N, chi2, KS, MAD and MSE of the
+            test for each group, and, if Z_scores is True, a DataFrame with
+            the Z scores, indexed by group and with the digits as columns.
+            Groups with no records left for the test have N of 1 and a NaN
+            chi2, as a Test would.
+    """
+    digs = _check_test_(test)
+    values = asarray(frame[column])
+    keep = _sign_mask_(values, sign)
+    codes, groups = factorize(asarray(frame[by])[keep], sort=True)
+    _, ZN = scale_records(values[keep], decimals, sign)
+    col = digs_dict[digs]
+    digits = extract_digits(ZN, [col])[col]
+    lo, hi = _bins_(digs)
+    n_bins = hi - lo
+    # the group code and the digit combined in a single key; factorize
+    # gives -1 to missing keys, which are left out as well
+    valid = (digits >= lo) & (digits < hi) & (codes >= 0)
+    keys = codes[valid].astype(int64) * n_bins + (digits[valid] - lo)
+    counts = bincount(keys, minlength=len(groups) * n_bins).reshape(
+        len(groups), n_bins)
+    total = counts.sum(axis=1)
+    if limit_N is not None and (not isinstance(limit_N, int) or
+                                limit_N < 0):
+        raise ValueError("limit_N must be None or a positive integer.")
+    N = total if limit_N is None else minimum(total, limit_N)
+    N = maximum(N, 1)
+    with errstate(divide='ignore', invalid='ignore'):
+        stats = tests_by_row(counts, _expected_(digs)[0], N)
+    index = Index(groups, name=by)
+    results = DataFrame({'N': N, 'chi2': stats['chi2'], 'KS': stats['KS'],
+                         'MAD': stats['MAD'], 'MSE': stats['MSE']},
+                        index=index)
+    if Z_scores:
+        return results, DataFrame(stats['Z_score'], index=index,
+                                  columns=_index_(digs))
+    return results
@@ -0,0 +1,198 @@
+from os.path import getsize
+from numpy import load, memmap, zeros, dtype as np_dtype
+from pandas import read_csv as pd_read_csv
+from .accumulator import BenfordAccumulator
+from .external import external_sorted_diffs, RUN_SIZE, BLOCK
+
+
+# Number of records handed to the digits extraction at a time, which bounds
+# the memory used besides the input itself (about 100 bytes per record)
+WINDOW = 2 ** 20
+# Number of CSV rows parsed at a time
+CHUNKSIZE = 2 ** 18
+
+
+def accumulate(arr, window=WINDOW, **kwargs):
+    """Feeds a 1D array, typically a memory map, to a BenfordAccumulator in
+    fixed-size windows, so that only one window at a time is read and
+    processed.
+
+    Args:
+        arr: numpy 1D array or memmap of integers or floats.
+        window: number of records per window. Defaults to WINDOW.
+        kwargs: decimals, sign, confidence and limit_N, passed on to the
+            BenfordAccumulator.
+
+    Returns:
+        BenfordAccumulator, from which the tests can be built.
+
+    Raises:
+        ValueError: if the array is not 1D or window is not positive.
+    """
+    if arr.ndim != 1:
+        raise ValueError('The array must be 1D.')
+    if window < 1:
+        raise ValueError('window must be a positive integer.')
+    acc = BenfordAccumulator(**kwargs)
+    for start in range(0, len(arr), window):
+        acc.update(arr[start:start + window])
+    return acc
+
+
+def accumulate_sec_order(arr, run_size=RUN_SIZE, block=BLOCK, sign='all',
+                         sign_first=True, tmpdir=None, **kwargs):
+    """Feeds the differences between the ordered records of a 1D array,
+    typically a memory map, to a BenfordAccumulator, for the Second Order
+    tests. The array is sorted out of core, in runs of run_size records
+    saved to temporary files and merged back, so that memory does not
+    depend on its size.
+
+    Args:
+        arr: numpy 1D array or memmap of integers or floats.
+        run_size: number of records sorted at a time. Defaults to RUN_SIZE.
+        block: number of records buffered from all the runs together while
+            merging. Defaults to BLOCK.
+        sign: tells which portion of the data to consider. pos: only the
+            positive entries; neg: only negative entries; all: all entries
+            but zeros. Defaults to all.
+        sign_first: applies the sign to the records, before taking their
+            differences, as second_order() does, instead of to the
+            differences, as Benford.sec_order() does. Defaults to True.
+        tmpdir: directory in which to create the temporary one with the
+            runs. Defaults to None, for the system's default.
+        kwargs: decimals, confidence and limit_N, passed on to the
+            BenfordAccumulator.
+
+    Returns:
+        BenfordAccumulator of the differences, from which the tests can be
+            built with sec_order=True.
+
+    Raises:
+        ValueError: if the array is not 1D or run_size or block are not
+            positive.
+    """
+    if arr.ndim != 1:
+        raise ValueError('The array must be 1D.')
+    if run_size < 1 or block < 1:
+        raise ValueError('run_size and block must be positive integers.')
+    acc = BenfordAccumulator(sign='all' if sign_first else sign, **kwargs)
+    for diffs in external_sorted_diffs(arr, run_size, block,
+                                       sign if sign_first else None, tmpdir):
+        for start in range(0, len(diffs), WINDOW):
+            acc.update(diffs[start:start + WINDOW])
+    return acc
+
+
+def read_npy(path, window=WINDOW, sec_order=False, run_size=RUN_SIZE,
+             **kwargs):
+    """Analyses a 1D array saved in a .npy file, memory-mapping it instead
+    of loading it.
+
+    Args:
+        path: path of the .npy file.
+        window: number of records per window. Defaults to WINDOW.
+        sec_order: analyses the differences between the ordered records
+            instead, for the Second Order tests, sorting them out of core
+            with accumulate_sec_order. Defaults to False.
+        run_size: number of records sorted at a time if sec_order. Defaults
+            to RUN_SIZE.
+        kwargs: decimals, sign, confidence and limit_N, passed on to the
+            BenfordAccumulator.
+
+    Returns:
+        BenfordAccumulator, from which the tests can be built.
+    """
+    arr = load(path, mmap_mode='r')
+    if sec_order:
+        return accumulate_sec_order(arr, run_size, **kwargs)
+    return accumulate(arr, window, **kwargs)
+
+
+def read_raw(path, dtype='int64', window=WINDOW, sec_order=False,
+             run_size=RUN_SIZE, **kwargs):
+    """Analyses a raw binary file of little-endian int64 or float64 records,
+    with no header, memory-mapping it instead of loading it.
+
+    Args:
+        path: path of the file.
+        dtype: 'int64' or 'float64'. Defaults to 'int64'.
+        window: number of records per window. Defaults to WINDOW.
+        sec_order: analyses the differences between the ordered records
+            instead, for the Second Order tests, sorting them out of core
+            with accumulate_sec_order. Defaults to False.
+        run_size: number of records sorted at a time if sec_order. Defaults
+            to RUN_SIZE.
+        kwargs: decimals, sign, confidence and limit_N, passed on to the
+            BenfordAccumulator.
+
+    Returns:
+        BenfordAccumulator, from which the tests can be built.
+
+    Raises:
+        ValueError: if dtype is not 'int64' nor 'float64'.
+    """
+    if dtype not in ['int64', 'float64']:
+        raise ValueError("Parameter -dtype- must be 'int64' or 'float64'.")
+    dtype = np_dtype(dtype).newbyteorder('<')
+    # an empty file cannot be memory-mapped
+    if getsize(path) == 0:
+        arr = zeros(0, dtype=dtype)
+    else:
+        arr = memmap(path, dtype=dtype, mode='r')
+    if sec_order:
+        return accumulate_sec_order(arr, run_size, **kwargs)
+    return accumulate(arr, window, **kwargs)
+
+
+def read_csv(path, columns, chunksize=CHUNKSIZE, decimals=2, sign='all',
+             confidence=95, limit_N=None, **kwargs):
+    """Analyses numeric columns of a CSV file, parsing it in chunks of rows
+    and keeping only the digits histograms and summation sums of each
+    column, so memory does not depend on the file size.
+
+    As in Base, the columns parsed as integers ignore decimals. Each column
+    keeps the kind found in the first chunk: the integer ones stay integers
+    even if a later chunk is parsed as floats because of missing values,
+    and the float ones stay floats even if a later chunk holds no fraction.
+
+    Args:
+        path: path or buffer of the CSV file.
+        columns: list with the names of the columns to analyse.
+        chunksize: number of rows parsed at a time. Defaults to CHUNKSIZE.
+        decimals: number of decimal places to consider, or 'infer', for all
+            the float columns, or a dict with it by column name. Defaults
+            to 2.
+        sign: tells which portion of the data to consider. pos: only the
+            positive entries; neg: only negative entries; all: all entries
+            but zeros. Defaults to all.
+        confidence: confidence level of the tests. Defaults to 95.
+        limit_N: sets a limit to N as the sample size for the calculation of
+            the Z scores if the sample is too big. Defaults to None.
+        kwargs: other keyword arguments for pandas.read_csv, such as sep or
+            thousands.
+
+    Returns:
+        Dict with a BenfordAccumulator for each column.
+    """
+    if not isinstance(decimals, dict):
+        decimals = {col: decimals for col in columns}
+
+    ints = None
+    accs = {}
+    for chunk in pd_read_csv(path, usecols=columns, chunksize=chunksize,
+                             **kwargs):
+        if ints is None:
+            ints = {col: chunk[col].dtype.kind in 'iu' for col in columns}
+            accs = {col: BenfordAccumulator(
+                decimals=0 if ints[col] else decimals[col], sign=sign,
+                confidence=confidence, limit_N=limit_N) for col in columns}
+        for col, acc in accs.items():
+            # the float columns stay floats in the chunks parsed as integers,
+            # which scale_records would not scale
+            acc.update(chunk[col].to_numpy() if ints[col] else
+                       chunk[col].to_numpy(dtype='float64'))
+    if ints is None:
+        accs = {col: BenfordAccumulator(decimals=decimals[col], sign=sign,
+                                        confidence=confidence,
+                                        limit_N=limit_N) for col in columns}
+    return accs
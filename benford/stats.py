@@ -1,4 +1,4 @@
-from numpy import sqrt
+from numpy import sqrt, abs as np_abs, maximum
 from .constants import crit_chi2, KS_crit, mad_dict, digs_dict
 
 
@@ -159,3 +159,44 @@ def mse(frame, verbose=True):
         print(f"\nMean Square Error = {mse}")
 
     return mse
+
+
+def tests_by_row(counts, expected, N=None, stats=None):
+    """Computes the tests' statistics for many samples at once, one sample
+    (a digits histogram) per row, with the same formulas as Z_score,
+    chi_sq_2, kolmogorov_smirnov_2, and the MAD and MSE of the Test objects.
+
+    Args:
+        counts: 2D array with the occurrences of each of the test's digits,
+            in the order of the Expected index, one row per sample.
+        expected: 1D array with the test's expected proportions.
+        N: 1D array with the sample size to consider for the Z scores of
+            each row. Only needed for the Z scores.
+        stats: list with the statistics to compute, among 'chi2', 'KS',
+            'MAD', 'MSE' and 'Z_score'. Defaults to None, for all of them.
+
+    Returns:
+        Dict with the 1D arrays 'chi2', 'KS', 'MAD' and 'MSE' and the 2D
+            array 'Z_score', or those of them in stats.
+    """
+    if stats is None:
+        stats = ['chi2', 'KS', 'MAD', 'MSE', 'Z_score']
+    total = counts.sum(axis=1, keepdims=True)
+    found = counts / maximum(total, 1)
+    res = {}
+    if 'chi2' in stats:
+        exp_counts = total * expected
+        res['chi2'] = ((counts - exp_counts) ** 2 / exp_counts).sum(axis=1)
+    if 'KS' in stats:
+        res['KS'] = np_abs(found.cumsum(axis=1) - expected.cumsum()).max(axis=1)
+    if {'MAD', 'MSE', 'Z_score'} & set(stats):
+        abs_dif = np_abs(found - expected)
+    if 'MAD' in stats:
+        res['MAD'] = abs_dif.mean(axis=1)
+    if 'MSE' in stats:
+        res['MSE'] = (abs_dif ** 2).mean(axis=1)
+    if 'Z_score' in stats:
+        N = N.reshape(-1, 1)
+        res['Z_score'] = (abs_dif - (1 / (2 * N))) / sqrt(
+            (expected * (1. - expected)) / N)
+    return res
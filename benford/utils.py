@@ -1,11 +1,28 @@
-from pandas import Series, DataFrame
-from numpy import array, arange, log10, ndarray
-from .expected import _test_
-from .constants import digs_dict, rev_digs
-from .stats import Z_score
+from pandas import Series, DataFrame, DatetimeIndex, Timedelta, \
+    date_range
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick, Day, Week, MonthEnd, QuarterEnd, \
+    YearEnd, BMonthEnd, BQuarterEnd, BYearEnd
+from numpy import array, arange, log10, ndarray, asarray, full, zeros, \
+    int64, float64, floor_divide, remainder, minimum, maximum, floor, rint, \
+    where, isfinite, iinfo, min_scalar_type, dtype as np_dtype, bincount, \
+    cos, sin, pi, errstate, isnan, absolute, searchsorted, nan, diff, add
+from .expected import _test_, _expected_, _index_
+from .constants import digs_dict, rev_digs, compact_dtypes
+from .stats import Z_score, tests_by_row
 from .checks import _check_num_array_, _check_sign_, _check_decimals_
 
 
+# Powers of ten that fit in an int64, used to scale the records by their
+# order of magnitude
+_POW10_ = 10 ** arange(19, dtype=int64)
+_FLOAT_POW10_ = 10. ** arange(309)
+# Calendar offsets whose periods end with their anchor dates, as in
+# pandas' resample
+_END_OFFSETS_ = (MonthEnd, QuarterEnd, YearEnd, BMonthEnd, BQuarterEnd,
+                 BYearEnd, Week)
+
+
 def _set_N_(len_df, limit_N):
     """"""
     # Assigning to N the superior limit or the lenght of the series
@@ -75,6 +92,76 @@ def set_sign(data, sign="all"):
     return data.dropna()
 
 
+def _div_pow10_(arr, scale):
+    """Divides arr by 10 ** scale with a single correctly rounded float
+    operation, multiplying when the scale is negative. Scales past the
+    float range, which only the extreme records reach, take a second
+    operation, overflowing to inf as the exact result would.
+    """
+    size = abs(scale)
+    pw = _FLOAT_POW10_[minimum(size, 308)]
+    # the power of the branch not taken is 1, an exact operation, so that
+    # it cannot overflow
+    div = scale >= 0
+    with errstate(over='ignore'):
+        out = arr / where(div, pw, 1.) * where(div, 1., pw)
+        if (size > 308).any():
+            rest = _FLOAT_POW10_[maximum(size - 308, 0)]
+            out = out / where(div, rest, 1.) * where(div, 1., rest)
+    return out
+
+
+def infer_ZN(ab):
+    """Takes up to the first five significant digits of each record, as
+    they show in the record's float repr without the dot and the leading
+    zeros (so 0.0123 gives 123, 1.5 gives 15 and 20.0 gives 200), which is
+    what decimals='infer' means. Numeric and vectorized, with no
+    intermediate strings but for the records below 1e-18 or from 1e27.
+
+    Args:
+        ab: array or Series of non-negative floats.
+
+    Returns:
+        Array of ints with the inferred ZN.
+    """
+    ab = asarray(ab, dtype=float64)
+    ZN = zeros(len(ab), dtype=int64)
+    pos = (ab > 0) & isfinite(ab)
+    v = ab[pos]
+    # decimal exponent, fixing log10 when it rounds across a power of ten
+    e = floor(log10(v)).astype(int64)
+    e -= v < _div_pow10_(1., -e)
+    e += v >= _div_pow10_(1., -e - 1)
+    # longer reprs are cut after five digits, which is the floor of the
+    # scaled record, up to the float rounding of the scaling itself
+    scaled = _div_pow10_(v, e - 4)
+    cut = floor(scaled)
+    cut -= _div_pow10_(cut, 4 - e) > v
+    cut += _div_pow10_(cut + 1, 4 - e) <= v
+    # records whose shortest repr has up to five significant digits are
+    # the ones whose five-digit rounding parses back to the very same float;
+    # their repr has those digits but the trailing zeros
+    near = (abs(scaled - rint(scaled)) < 1e-9).nonzero()[0]
+    lead = rint(scaled[near]).astype(int64)
+    short = _div_pow10_(lead, 4 - e[near]) == v[near]
+    near, lead = near[short], lead[short]
+    sig = 5 - sum(lead % _POW10_[k] == 0 for k in range(1, 5))
+    # round numbers still show the units and a trailing '.0'
+    vn, en = v[near], e[near]
+    whole = (vn == floor(vn)) & (vn < 1e16)
+    ndig = where(whole, minimum(en + 2, 5), sig)
+    cut[near] = lead // _POW10_[5 - ndig]
+    # past 10 ** 22 the powers of ten are no longer exact floats, so the
+    # checks above may be off by the last bit: the few records of such
+    # magnitudes take the digits of their repr, which is in scientific
+    # notation for all of them
+    far = (abs(e - 4) > 22).nonzero()[0]
+    cut[far] = [int(repr(x).partition('e')[0].replace('.', '')[:5])
+                for x in v[far].tolist()]
+    ZN[pos] = cut
+    return ZN
+
+
 def get_times_10_power(data, decimals=2):
     """"""
     decimals = _check_decimals_(decimals)
@@ -85,15 +172,144 @@ def get_times_10_power(data, decimals=2):
         data['ZN'] = ab
     else:
         if decimals == 'infer':
-            data['ZN'] = ab.astype(str).str\
-                .replace('.', '')\
-                .str.lstrip('0')\
-                .str[:5].astype(int)
+            data['ZN'] = infer_ZN(ab)
         else:
             data['ZN'] = (ab * (10 ** decimals)).astype(int)
     return data
 
 
+def _sign_mask_(seq, sign='all'):
+    """Boolean mask of the records of the chosen sign that are not NaN.
+
+    Raises:
+        TypeError: if not receiving integers or floats.
+    """
+    sign = _check_sign_(sign)
+    if seq.dtype.kind not in 'iuf':
+        raise TypeError("The sequence dtype was not int nor float. Convert "
+                        "it to whether int of float, and try again.")
+    if sign == 'all':
+        # NaN != 0 holds, so they are left out explicitly
+        return (seq != 0) & ~isnan(seq)
+    elif sign == 'pos':
+        return seq > 0
+    return seq < 0
+
+
+def scale_records(data, decimals=2, sign='all'):
+    """Applies the Base pre-processing to a plain array: keeps the records
+    of the chosen sign, drops NaNs and turns the absolute values into the
+    integers the digits are taken from.
+
+    Args:
+        data: numpy 1D array or pandas Series of integers or floats.
+        decimals: number of decimal places to consider, or 'infer'.
+            Ignored for integers. Defaults to 2.
+        sign: 'all', 'pos' or 'neg'. Defaults to 'all'.
+
+    Returns:
+        Tuple with the kept records and their ZN (int64) arrays.
+
+    Raises:
+        TypeError: if not receiving integers or floats.
+    """
+    decimals = _check_decimals_(decimals)
+    seq = asarray(data)
+    seq = seq[_sign_mask_(seq, sign)]
+    ab = absolute(seq)
+    if seq.dtype.kind in 'iu':
+        ZN = ab.astype(int64)
+    elif decimals == 'infer':
+        ZN = infer_ZN(ab)
+    else:
+        ZN = (ab * (10 ** decimals)).astype(int64)
+    return seq, ZN
+
+
+def _magnitude_(ZN):
+    """Computes the order of magnitude (the number of digits minus one) of
+    each record, -1 for zeros. Integer-only, by looking the records up in the
+    table of powers of ten, so it is exact for the whole int64 range, unlike
+    log10, which rounds 999999999999999999 up to 18.
+    """
+    return _POW10_.searchsorted(ZN, side='right') - 1
+
+
+def _sentinel_(dtype):
+    """Value marking, in a digits column, the records to be discarded from the
+    test: -1 for the default int64 columns and the dtype's maximum for the
+    unsigned compact ones.
+    """
+    dtype = np_dtype(dtype)
+    return iinfo(dtype).max if dtype.kind == 'u' else -1
+
+
+def _digits_buffer_(n, col, compact=False):
+    """Allocates a digits column filled with its discard sentinel"""
+    dtype = compact_dtypes[col] if compact else int64
+    return full(n, _sentinel_(dtype), dtype=dtype)
+
+
+def narrow_uint(arr):
+    """Casts an array of non-negative integers to the narrowest unsigned
+    integer dtype that holds all its values.
+    """
+    arr = asarray(arr)
+    if len(arr) == 0:
+        return arr.astype('uint8')
+    return arr.astype(min_scalar_type(arr.max()))
+
+
+def extract_digits(ZN, cols=None, compact=False):
+    """Extracts the digits used by the tests in a single pass, computing
+    the order of magnitude of each record only once and filling
+    preallocated integer buffers.
+
+    Args:
+        ZN: array or Series of non-negative integers.
+        cols: list with the test columns to extract ('F1D', 'F2D', 'F3D',
+            'SD' and/or 'L2D'). Defaults to None, which extracts all five.
+        compact: stores the digits as uint8 (uint16 for F3D), with the dtype's
+            maximum as sentinel, instead of int64 and -1. Defaults to False.
+
+    Returns:
+        dict with an int array for each of the chosen columns, with the
+            sentinel (-1 if not compact) where the record is too small for
+            the test, to be discarded later.
+    """
+    if cols is None:
+        cols = list(digs_dict.values())
+    ZN = asarray(ZN, dtype=int64)
+    mag = _magnitude_(ZN)
+    digits = {}
+    # the first digits (and the second one) all come from the same leading
+    # chunk of the number, so one division by a power of ten is enough
+    firsts = [rev_digs[col] for col in cols if col in ['F1D', 'F2D', 'F3D']]
+    if 'SD' in cols:
+        firsts.append(2)
+    if firsts:
+        need = max(firsts)
+        lead = ZN // _POW10_[maximum(mag - (need - 1), 0)]
+        held = minimum(mag + 1, need)
+        for k in range(need, 0, -1):
+            col = digs_dict[k]
+            if col not in cols and not (k == 2 and 'SD' in cols):
+                continue
+            buf = _digits_buffer_(len(ZN), col, compact)
+            floor_divide(lead, _POW10_[maximum(held - k, 0)], out=buf,
+                         where=mag >= k - 1, casting='unsafe')
+            if col in cols:
+                digits[col] = buf
+            if k == 2 and 'SD' in cols:
+                sd = _digits_buffer_(len(ZN), 'SD', compact)
+                digits['SD'] = remainder(buf, 10, out=sd, where=mag >= 1)
+    if 'L2D' in cols:
+        buf = _digits_buffer_(len(ZN), 'L2D', compact)
+        digits['L2D'] = remainder(ZN, 100, out=buf, where=mag >= 3,
+                                  casting='unsafe')
+    return {col: digits[col] for col in cols}
+
+
 def get_digs(data, decimals=2, sign="all"):
     """ 
     """
@@ -103,29 +319,130 @@ def get_digs(data, decimals=2, sign="all"):
 
     df = get_times_10_power(df, decimals=decimals)
 
-    # First digits
-    for col in ['F1D', 'F2D', 'F3D']:
-        temp = df.ZN.loc[df.ZN >= 10 ** (rev_digs[col] - 1)]
-        df[col] = (temp // 10 ** ((log10(temp).astype(int)) -
-                                  (rev_digs[col] - 1)))
-        # fill NANs with -1, which is a non-usable value for digits,
-        # to be discarded later.
-        df[col] = df[col].fillna(-1).astype(int)
-    # Second digit
-    temp_sd = df.loc[df.ZN >= 10]
-    df['SD'] = (temp_sd.ZN // 10**((log10(temp_sd.ZN)).astype(int) -
-                                   1)) % 10
-    df['SD'] = df['SD'].fillna(-1).astype(int)
-    # Last two digits
-    temp_l2d = df.loc[df.ZN >= 1000]
-    df['L2D'] = temp_l2d.ZN % 100
-    df['L2D'] = df['L2D'].fillna(-1).astype(int)
+    # -1 marks the records too small for a test, to be discarded later
+    for col, digits in extract_digits(df.ZN).items():
+        df[col] = digits
     return df
 
 
+def _bins_(digs):
+    """Lowest and highest (exclusive) values the digits of a test can take
+    """
+    if digs in [1, 2, 3]:
+        return 10 ** (digs - 1), 10 ** digs
+    elif digs == 22:
+        return 0, 10
+    else:
+        return 0, 100
+
+
+def digit_counts(digits, digs, weights=None):
+    """Histogram of a digits column over all the possible digits of the
+    test, leaving out the discarded records (-1 or the compact sentinel).
+
+    Args:
+        digits: array or Series with the digits of the chosen test.
+        digs: the test: 1, 2, 3, 22 or -2.
+        weights: array or Series of the same length, to be summed for each
+            digit instead of counting the records. Defaults to None.
+
+    Returns:
+        Array with the counts (or sums) of each possible digit, in the order
+            of the test's Expected index.
+    """
+    lo, hi = _bins_(digs)
+    digits = asarray(digits)
+    keep = (digits >= lo) & (digits < hi)
+    if weights is not None:
+        weights = asarray(weights)[keep]
+    return bincount(digits[keep], weights=weights, minlength=hi)[lo:]
+
+
+def digit_sums(digits, digs, values):
+    """Sums of the records' values by their digits, for the Summation test,
+    over all the possible digits of the test, leaving out the discarded
+    records (-1 or the compact sentinel). Float values go through a weighted
+    bincount. Integer values are summed exactly in int64, which float64 sums
+    would round past 2 ** 53, unless the sums could overflow it.
+
+    Args:
+        digits: array or Series with the digits of the chosen test.
+        digs: the test: 1, 2, 3, 22 or -2.
+        values: array or Series of the same length, with the (absolute)
+            values to sum.
+
+    Returns:
+        Array with the sums of each possible digit, in the order of the
+            test's Expected index.
+    """
+    lo, hi = _bins_(digs)
+    digits = asarray(digits)
+    keep = (digits >= lo) & (digits < hi)
+    digits = digits[keep] - lo
+    values = asarray(values)[keep]
+    if values.dtype.kind in 'iu' and (not len(values) or int(values.max()) <=
+                                      iinfo(int64).max // len(values)):
+        sums = zeros(hi - lo, dtype=int64)
+        add.at(sums, digits, values.astype(int64))
+        return sums
+    return bincount(digits, weights=values, minlength=hi - lo)
+
+
+def mantissa_moments(mant):
+    """Sums from which the mantissas statistics can be computed, which can
+    be kept and added up instead of the mantissas themselves.
+
+    Args:
+        mant: array or Series of mantissas.
+
+    Returns:
+        Array with the number of mantissas, the sums of their first four
+            powers, and the sums of their cosines and sines around the circle.
+    """
+    mant = asarray(mant, dtype=float64)
+    sq = mant ** 2
+    return array([len(mant), mant.sum(), sq.sum(), (sq * mant).sum(),
+                  (sq ** 2).sum(), cos(2 * pi * mant).sum(),
+                  sin(2 * pi * mant).sum()])
+
+
+def mantissas_stats(moments):
+    """Mean, variance, skewness, kurtosis and gravity center of the
+    mantissas from their sums, with the same (unbiased) estimators pandas
+    uses.
+
+    Args:
+        moments: array returned by mantissa_moments (or a sum of them).
+
+    Returns:
+        dict with the mantissas statistics, as the Mantissas stats attribute.
+    """
+    n, s1, s2, s3, s4, s_cos, s_sin = moments
+    with errstate(divide='ignore', invalid='ignore'):
+        mean = s1 / n
+        # sums of the powers of the deviations from the mean
+        m2 = s2 - n * mean ** 2
+        m3 = s3 - 3 * mean * s2 + 2 * n * mean ** 3
+        m4 = s4 - 4 * mean * s3 + 6 * mean ** 2 * s2 - 3 * n * mean ** 4
+        skew = n * (n - 1) ** .5 / (n - 2) * m3 / m2 ** 1.5
+        kurt = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) -
+                3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+        return {'Mean': mean, 'Var': m2 / (n - 1), 'Skew': skew,
+                'Kurt': kurt, 'gravity_center': (s_cos / n, s_sin / n)}
+
+
 def get_proportions(data):
     """
     """
+    arr = asarray(data)
+    # digits columns span at most a thousand values, which are counted
+    # into a dense array instead of hashing every record
+    if arr.dtype.kind in 'iu' and len(arr) and arr.max() - arr.min() <= 1000:
+        lo = arr.min()
+        counts = bincount(arr - lo)
+        found = counts.nonzero()[0]
+        counts = Series(counts[found], index=found + lo)
+        return DataFrame({'Counts': counts, 'Found': counts / len(arr)})
     counts = data.value_counts()
     # get their relative frequencies
     proportions = data.value_counts(normalize=True)
@@ -148,8 +465,19 @@ def prepare(data, digs, limit_N=None, simple=False):
     by the ocurrences of the chosen digits, creating other computed
     columns
     """
-    df = get_proportions(data)
-    dd = join_expect_found_diff(df, digs)
+    arr = asarray(data)
+    if arr.dtype.kind in 'iu':
+        # one bincount over the test's digits gives both Counts and Found
+        expected = _expected_(digs)[0]
+        counts = digit_counts(arr, digs)
+        found = counts / max(len(arr), 1)
+        dif = found - expected
+        dd = DataFrame({'Expected': expected, 'Counts': counts,
+                        'Found': found, 'Dif': dif, 'AbsDif': absolute(dif)},
+                       index=_index_(digs))
+    else:
+        df = get_proportions(data)
+        dd = join_expect_found_diff(df, digs)
     if simple:
         del dd['Dif']
         return dd
@@ -159,65 +487,293 @@ def prepare(data, digs, limit_N=None, simple=False):
         return N, dd
 
 
+def sorted_diffs(data, overwrite=False):
+    """Subtracts the sorted sequence elements from each other, discarding
+    zeros and NaNs. Used in the Second Order test. The records are copied
+    once, as float64, into a buffer that is sorted in place, and the
+    differences taken with numpy, so no shifted copies are made.
+
+    Args:
+        data: numpy 1D array or pandas Series of integers or floats.
+        overwrite: sorts data itself, with no copy, if it is a float64
+            array no longer needed. Defaults to False.
+
+    Returns:
+        1D float64 array with the nonzero differences, in ascending order of
+            the records.
+    """
+    if overwrite:
+        arr = asarray(data, dtype=float64)
+    else:
+        arr = array(data, dtype=float64)
+    arr.sort()
+    # the NaNs are sorted to the end
+    arr = arr[:len(arr) - int(isnan(arr).sum())]
+    diffs = diff(arr)
+    del arr
+    return diffs[diffs != 0]
+
+
 def subtract_sorted(data):
     """Subtracts the sorted sequence elements from each other, discarding zeros.
     Used in the Second Order test
     """
-    temp = data.copy().sort_values(ignore_index=True)
-    temp = (temp - temp.shift(1)).dropna()
-    return temp.loc[temp != 0]
+    return Series(sorted_diffs(data))
 
 
-def prep_to_roll(start, test):
-    """Used by the rolling mad and rolling mean, prepares each test and
-    respective expected proportions for later application to the Series subset
+def _cum_counts_(bins, n_bins, pos, state):
+    """Histograms of bins[:p] for each p of the non-decreasing pos, counting
+    only the records after the position of the previous call, whose
+    histogram is carried in state ([position, histogram]).
     """
-    if test in [1, 2, 3]:
-        start[digs_dict[test]] = start.ZN // 10 ** ((
-            log10(start.ZN).astype(int)) - (test - 1))
-        start = start.loc[start.ZN >= 10 ** (test - 1)]
+    last, hist = state
+    # each record goes to the first position past it, so the cumulative
+    # sum over the positions gives all the records before each of them
+    ids = searchsorted(pos, arange(last, pos[-1]), side='right')
+    seg = bincount(ids * n_bins + bins[last:pos[-1]],
+                   minlength=len(pos) * n_bins).reshape(len(pos), n_bins)
+    cum = seg.cumsum(axis=0) + hist
+    state[0], state[1] = pos[-1], cum[-1].copy()
+    return cum
+
+
+def window_counts(bins, n_bins, starts, ends, block=None):
+    """Digits histograms of many windows over a sequence, window k holding
+    the records starts[k]:ends[k]. As both starts and ends are
+    non-decreasing, they work as two pointers moving forward: the histogram
+    up to each pointer is carried on from one window to the next and only
+    the records the pointer passes are counted, with a single bincount for
+    a whole block of windows, so each record is counted twice overall.
 
-        ind = arange(10 ** (test - 1), 10 ** test)
-        Exp = log10(1 + (1. / ind))
-
-    elif test == 22:
-        start[digs_dict[test]] = (start.ZN // 10 ** ((
-            log10(start.ZN)).astype(int) - 1)) % 10
-        start = start.loc[start.ZN >= 10]
+    Args:
+        bins: 1D int array with the bin (0 to n_bins - 1) of each record.
+        n_bins: number of bins.
+        starts: non-decreasing 1D int array with the windows' first records.
+        ends: non-decreasing 1D int array with the windows' ends (exclusive).
+        block: number of windows per block. Defaults to None, for about 2M
+            histogram cells per block.
+
+    Yields:
+        Tuples with the number of the block's first window and a 2D array
+            with the block's histograms, one window per row.
+    """
+    bins = asarray(bins, dtype=int64)
+    starts = asarray(starts, dtype=int64)
+    ends = asarray(ends, dtype=int64)
+    if block is None:
+        block = max(1, 2 ** 21 // n_bins)
+    start_state = [0, zeros(n_bins, dtype=int64)]
+    end_state = [0, zeros(n_bins, dtype=int64)]
+    for k0 in range(0, len(ends), block):
+        k1 = k0 + block
+        yield k0, _cum_counts_(bins, n_bins, ends[k0:k1], end_state) - \
+            _cum_counts_(bins, n_bins, starts[k0:k1], start_state)
+
+
+def _row_stats_(counts, expected, stats):
+    """tests_by_row's statistics, as well as the histograms' sizes (N)"""
+    res = tests_by_row(counts, expected, stats=stats)
+    if 'N' in stats:
+        res['N'] = counts.sum(axis=1)
+    return res
+
+
+def window_stats(digits, digs, starts, ends, stats=('MAD',)):
+    """Computes tests' statistics over many windows of a digits sequence,
+    from the windows' histograms given by window_counts.
 
-        Expec = log10(1 + (1. / arange(10, 100)))
-        temp = DataFrame({'Expected': Expec, 'Sec_Dig':
-                          array(list(range(10)) * 9)})
-        Exp = temp.groupby('Sec_Dig').sum().values.reshape(10,)
-        ind = arange(0, 10)
+    Args:
+        digits: 1D int array with the test's digits of the records, all of
+            them valid (no discarded records).
+        digs: the test: 1, 2, 3, 22 or -2.
+        starts: non-decreasing 1D int array with the windows' first records.
+        ends: non-decreasing 1D int array with the windows' ends (exclusive).
+        stats: the statistics to compute, among 'N' (the number of
+            records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to ('MAD',).
 
+    Returns:
+        Dict with a 1D array of each statistic, one value per window.
+    """
+    lo, hi = _bins_(digs)
+    expected = _expected_(digs)[0]
+    res = {stat: zeros(len(ends), dtype=int64 if stat == 'N' else float64)
+           for stat in stats}
+    with errstate(divide='ignore', invalid='ignore'):
+        for k0, counts in window_counts(asarray(digits) - lo, hi - lo,
+                                        starts, ends):
+            for stat, vals in _row_stats_(counts, expected, stats).items():
+                res[stat][k0:k0 + len(vals)] = vals
+    return res
+
+
+def _periods_(index, freq):
+    """The labels and the (exclusive) ends of the periods of a frequency
+    spanned by a sorted DatetimeIndex, each period being [start, end).
+    Fixed frequencies ('h', 'D', '7D') are labelled by their start, their
+    first period starting with the first record's day, or, if shorter than
+    a day, at the first multiple of the frequency. Calendar frequencies are
+    labelled as their anchor dates: the period ends with the day of the
+    anchor for the end-anchored ones ('ME', 'QE', 'W') and starts with it
+    for the others ('MS', 'QS', 'B').
+    """
+    if isinstance(freq, Tick):
+        # Day is a Tick before pandas 3
+        length = Timedelta(freq)
+    elif isinstance(freq, Day):
+        length = Timedelta(days=freq.n)
+    else:
+        length = None
+    first, last = index[0], index[-1]
+    if length is not None:
+        first = first.floor(length) if length < Timedelta('1D') else \
+            first.normalize()
+        labels = date_range(first, last, freq=length, name=index.name)
+        return labels, labels + length
+    first, last = first.normalize(), last.normalize()
+    if isinstance(freq, _END_OFFSETS_) and not (
+            isinstance(freq, Week) and freq.weekday is None):
+        labels = date_range(freq.rollforward(first), last + freq, freq=freq,
+                            name=index.name)
+        # up to the first period holding the last record
+        labels = labels[:labels.searchsorted(last, side='left') + 1]
+        return labels, labels + Timedelta('1D')
+    labels = date_range(freq.rollback(first), freq.rollback(last), freq=freq,
+                        name=index.name)
+    return labels, labels + freq
+
+
+def _window_bounds_(index, window, step=1):
+    """The first records (starts), the ends (exclusive) and the labels of
+    the windows to compute, over the (valid) records with the given index.
+    Count windows take the window records before each end, time windows
+    the records within the window duration before it and, if window is
+    None, expanding windows all the records before it. The ends are every
+    step-th record, after the first full count window, or, if step is a
+    frequency string, the ends of its periods, as given by _periods_.
+    """
+    n = len(index)
+    expanding = window is None
+    timed = not expanding and not isinstance(window, int)
+    if timed or not isinstance(step, int):
+        if not isinstance(index, DatetimeIndex):
+            raise ValueError('Time-based windows and steps need the data '
+                             'with a DatetimeIndex.')
+        if not index.is_monotonic_increasing:
+            raise ValueError('The DatetimeIndex must be sorted.')
+    if timed:
+        try:
+            window = Timedelta(window)
+        except ValueError:
+            raise ValueError('window must be a positive integer or a fixed '
+                             "duration, such as '30D'.")
+        if window <= Timedelta(0):
+            raise ValueError('window must be a positive duration.')
+    elif not expanding and window < 1:
+        raise ValueError('window must be a positive integer.')
+
+    if isinstance(step, int):
+        if step < 1:
+            raise ValueError('step must be a positive integer or a frequency '
+                             'string.')
+        if timed or expanding:
+            ends = arange(1, n + 1)[step - 1::step]
+        else:
+            ends = arange(window, n + 1, step)
+        labels = index[ends - 1]
+        bounds, side = labels, 'right'
+    else:
+        if n == 0:
+            return (zeros(0, dtype=int64), zeros(0, dtype=int64),
+                    index[:0])
+        # one window per period, ending with it
+        labels, bounds = _periods_(index, to_offset(step))
+        side = 'left'
+        ends = index.searchsorted(bounds, side=side)
+    if expanding:
+        starts = zeros(len(ends), dtype=int64)
+    elif timed:
+        # the records within the window duration before the window's end
+        starts = index.searchsorted(bounds - window, side=side)
     else:
-        start[digs_dict[test]] = start.ZN % 100
-        start = start.loc[start.ZN >= 1000]
+        starts = ends - window
+    # leave out the incomplete count windows and the empty ones
+    keep = (starts >= 0) & (ends > starts)
+    return starts[keep], ends[keep], labels[keep]
+
 
-        ind = arange(0, 100)
-        Exp = array([1 / 99.] * 100)
+def rolling_stats(digits, digs, window, stats=('MAD',), step=1):
+    """Computes tests' statistics over windows of records, leaving out the
+    records discarded from the test.
 
-    return Exp, ind
+    Args:
+        digits: Series with the test's digits of the records, with -1 (or
+            the compact sentinel) for the records too small for the test.
+        digs: the test: 1, 2, 3, 22 or -2.
+        window: number of records in each window, or, if the Series has a
+            (sorted) DatetimeIndex, a fixed duration such as '30D', for the
+            records in the preceding 30 days. If None, each window holds all
+            the records up to its end (expanding windows).
+        stats: the statistics to compute, among 'N' (the number of
+            records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to ('MAD',).
+        step: computes only every step-th window. If the Series has a
+            DatetimeIndex, may be a frequency string, such as 'ME' or '7D',
+            for one window ending at the end of each period. Defaults to 1.
 
+    Returns:
+        DataFrame with a column for each statistic, indexed by the label of
+            each window's last record, or by the periods' labels.
 
-def mad_to_roll(arr, Exp, ind):
-    """Mean Absolute Deviation used in the rolling function
+    Raises:
+        ValueError: if window or step are not valid.
     """
-    prop = arr.value_counts(normalize=True).sort_index()
+    digits = digits.loc[digits != _sentinel_(digits.dtype)]
+    starts, ends, labels = _window_bounds_(digits.index, window, step)
+    return DataFrame(window_stats(digits.to_numpy(), digs, starts, ends,
+                                  stats), index=labels)
 
-    if len(prop) < len(Exp):
-        prop = prop.reindex(ind).fillna(0)
 
-    return abs(prop - Exp).mean()
+def rolling_tests_stats(digits, window, stats=('MAD',), step=1):
+    """Computes the statistics of several tests over the same windows of
+    records, whose bounds are found once for all the tests. Each test
+    leaves out of its histograms the records discarded from it.
 
+    Args:
+        digits: DataFrame with the digits of the records for each test, its
+            columns named after the tests (F1D, F2D, F3D, SD, L2D), with -1
+            (or the compact sentinel) for the records too small for the test.
+        window: number of records in each window, or, if the DataFrame has a
+            (sorted) DatetimeIndex, a fixed duration such as '30D'. If None,
+            each window holds all the records up to its end.
+        stats: the statistics to compute, among 'N' (the number of
+            records), 'chi2', 'KS', 'MAD' and 'MSE'. Defaults to ('MAD',).
+        step: computes only every step-th window. If the DataFrame has a
+            DatetimeIndex, may be a frequency string, such as 'ME', for one
+            window ending at the end of each period. Defaults to 1.
 
-def mse_to_roll(arr, Exp, ind):
-    """Mean Squared Error used in the rolling function
+    Returns:
+        DataFrame with a (test, statistic) column for each pair, indexed
+            by the label of each window's last record, or by the periods'
+            labels. The statistics are NaN for the windows with no records
+            left for the test.
     """
-    temp = arr.value_counts(normalize=True).sort_index()
-
-    if len(temp) < len(Exp):
-        temp = temp.reindex(ind).fillna(0)
-
-    return ((temp - Exp) ** 2).mean()
+    starts, ends, labels = _window_bounds_(digits.index, window, step)
+    res = {}
+    for col in digits.columns:
+        digs = rev_digs[col]
+        lo, hi = _bins_(digs)
+        arr = digits[col].to_numpy().astype(int64)
+        # the discarded records go to an extra bin, left out of the stats
+        bins = where((arr >= lo) & (arr < hi), arr - lo, hi - lo)
+        vals = {stat: zeros(len(ends), dtype=int64 if stat == 'N'
+                            else float64) for stat in stats}
+        with errstate(divide='ignore', invalid='ignore'):
+            for k0, counts in window_counts(bins, hi - lo + 1, starts, ends):
+                counts = counts[:, :-1]
+                empty = counts.sum(axis=1) == 0
+                for stat, v in _row_stats_(counts, _expected_(digs)[0],
+                                           stats).items():
+                    if stat != 'N':
+                        v[empty] = nan
+                    vals[stat][k0:k0 + len(v)] = v
+        res.update({(col, stat): v for stat, v in vals.items()})
+    return DataFrame(res, index=labels)
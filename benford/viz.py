@@ -1,9 +1,15 @@
 from numpy import array, arange, maximum, sqrt, ones
-import matplotlib.pyplot as plt
-from matplotlib.text import Annotation
 from .constants import colors, mad_dict
 
 
+def _plt_():
+    """Imports pyplot only when a plot is drawn, so that importing the
+    package does not load matplotlib.
+    """
+    import matplotlib.pyplot as plt
+    return plt
+
+
 def plot_expected(df, digs, save_plot=None, save_plot_kwargs=None):
     """Plots the Expected Benford Distributions
 
@@ -17,6 +23,7 @@ def plot_expected(df, digs, save_plot=None, save_plot_kwargs=None):
             matplotlib.pyplot.savefig()
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
     """
+    plt = _plt_()
     if digs in [1, 2, 3]:
         y_max = (df.Expected.max() + (10 ** -(digs) / 3)) * 100
         figsize = 2 * (digs ** 2 + 5), 1.5 * (digs ** 2 + 5)
@@ -87,6 +94,7 @@ def plot_digs(df, x, y_Exp, y_Found, N, figsize, conf_Z, text_x=False,
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
         
     """
+    plt = _plt_()
     if len(x) > 10:
         rotation = 90
     else:
@@ -148,6 +156,7 @@ def plot_sum(df, figsize, li, text_x=False, save_plot=None, save_plot_kwargs=Non
             matplotlib.pyplot.savefig()
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
     """
+    plt = _plt_()
     x = df.index
     rotation = 90 if len(x) > 10 else 0
     fig = plt.figure(figsize=figsize)
@@ -192,6 +201,7 @@ def plot_ordered_mantissas(col, figsize=(12, 12),
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
  
     """
+    plt = _plt_()
     ld = len(col)
     x = arange(1, ld + 1)
     n = ones(ld) / ld
@@ -233,6 +243,8 @@ def plot_mantissa_arc_test(df, gravity_center, grid=True, figsize=12,
             matplotlib.pyplot.savefig()
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
     """
+    plt = _plt_()
+    from matplotlib.text import Annotation
     fig = plt.figure(figsize=(figsize, figsize))
     ax = plt.subplot()
     ax.set_facecolor(colors['b'])
@@ -274,6 +286,7 @@ def plot_roll_mse(roll_series, figsize, save_plot=None, save_plot_kwargs=None):
             matplotlib.pyplot.savefig()
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
     """
+    plt = _plt_()
     fig, ax = plt.subplots(figsize=figsize)
     ax.set_facecolor(colors['b'])
     ax.plot(roll_series, color=colors['m'])
@@ -298,6 +311,7 @@ def plot_roll_mad(roll_mad, figsize, save_plot=None, save_plot_kwargs=None):
             matplotlib.pyplot.savefig()
             https://matplotlib.org/api/_as_gen/matplotlib.pyplot.savefig.html
     """
+    plt = _plt_()
     fig, ax = plt.subplots(figsize=figsize)
     ax.set_facecolor(colors['b'])
     ax.plot(roll_mad.roll_series, color=colors['m'])
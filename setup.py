@@ -15,6 +15,9 @@ setup(name='benford_py',
           'numpy',
           'matplotlib',
       ],
+      entry_points={
+          'console_scripts': ['benford=benford.cli:main'],
+      },
       zip_safe=False,
       classifiers=[
           'Programming Language :: Python :: 3',
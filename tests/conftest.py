@@ -162,4 +162,45 @@ def gen_join_expect_found_diff_SD(gen_proportions_SD):
 
 @pytest.fixture
 def gen_join_expect_found_diff_L2D(gen_proportions_L2D):
-    return ut.join_expect_found_diff(gen_proportions_L2D, -2)
\ No newline at end of file
+    return ut.join_expect_found_diff(gen_proportions_L2D, -2)
+
+
+# seeded, for the data the results are compared on, without touching the
+# global numpy random state the other fixtures draw from
+@pytest.fixture
+def gen_rng():
+    return np.random.RandomState(13)
+
+
+@pytest.fixture
+def gen_lognormal(gen_rng):
+    return gen_rng.lognormal(4, 3, 20000)
+
+
+@pytest.fixture
+def gen_signed_lognormal(gen_rng, gen_lognormal):
+    return gen_lognormal * gen_rng.choice([-1, 1], len(gen_lognormal))
+
+
+@pytest.fixture
+def gen_signed_array(gen_signed_lognormal):
+    arr = gen_signed_lognormal.copy()
+    arr[::97] = 0
+    arr[::101] = np.nan
+    return arr
+
+
+@pytest.fixture
+def gen_messy_array(gen_rng):
+    arr = gen_rng.lognormal(4, 3, 100003) * gen_rng.choice([-1, 1], 100003)
+    arr[::7] = np.round(arr[::7])
+    arr[::29] = np.nan
+    return arr
+
+
+@pytest.fixture
+def gen_frame(gen_rng):
+    return pd.DataFrame({'a': gen_rng.lognormal(3, 2, 5000),
+                         'b': gen_rng.randint(-10000, 10000, 5000),
+                         'c': gen_rng.rand(5000) * 1000,
+                         'name': ['x'] * 5000})
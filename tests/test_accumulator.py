@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+from ..benford import benford as bf
+from ..benford.accumulator import BenfordAccumulator, _HEADER_
+from ..benford.constants import digs_dict
+
+
+class Test_BenfordAccumulator():
+
+    @pytest.mark.parametrize('sign', ['all', 'pos', 'neg'])
+    def test_matches_Benford(self, gen_signed_array, sign):
+        benf = bf.Benford(gen_signed_array, sign=sign, summation=True,
+                          mantissas=True, verbose=False)
+        acc = BenfordAccumulator(sign=sign)
+        for chunk in np.array_split(gen_signed_array, 7):
+            acc.update(chunk)
+        assert acc.n_seen == len(gen_signed_array)
+        assert acc.n_records == len(benf.base)
+        assert acc.discarded == benf._discarded
+        for digs, col in digs_dict.items():
+            test = acc.test(col)
+            ref = getattr(benf, col)
+            assert (test.Counts.values == ref.Counts.values).all()
+            assert test.N == ref.N
+            assert test.MAD == pytest.approx(ref.MAD)
+            assert test.chi_square == pytest.approx(ref.chi_square)
+            assert test.KS == pytest.approx(ref.KS)
+            assert np.allclose(test.Z_score, ref.Z_score)
+        for col in ['F1D', 'F2D', 'F3D']:
+            summ = acc.summation(col)
+            ref = getattr(benf, f'{col}_Summ')
+            assert (summ.index == ref.index).all()
+            assert np.allclose(summ.Sum, ref.Sum)
+        stats = acc.mantissas().stats
+        for key, val in benf.Mantissas.stats.items():
+            assert stats[key] == pytest.approx(val)
+
+    def test_update_chains(self):
+        acc = BenfordAccumulator(decimals=0).update(np.arange(1, 1000))
+        assert acc.n_records == 999
+        assert acc.test(1).Counts.sum() == 999
+        assert acc.test(3).Counts.sum() == 900
+
+    def test_empty(self):
+        acc = BenfordAccumulator()
+        assert acc.test('F2D').Counts.sum() == 0
+        acc.update(np.array([]))
+        assert acc.n_seen == 0
+
+    def test_summation_test(self):
+        with pytest.raises(ValueError):
+            BenfordAccumulator().summation('SD')
+
+    def test_summation_too_small(self):
+        acc = BenfordAccumulator(decimals=0).update(np.array([1.5, 2.25, 13.]))
+        summ = acc.summation(3)
+        assert len(summ) == 0 and np.isnan(summ.MAD)
+
+    def test_update_confidence(self):
+        acc = BenfordAccumulator()
+        acc.update_confidence(99)
+        assert acc.test(1).confidence == 99
+        with pytest.raises(ValueError):
+            acc.update_confidence(93)
+
+    def test_merge(self, gen_signed_array):
+        parts = [BenfordAccumulator(decimals='infer').update(chunk)
+                 for chunk in np.array_split(gen_signed_array, 3)]
+        whole = BenfordAccumulator(decimals='infer').update(gen_signed_array)
+        merged = parts[0] + parts[1] + parts[2]
+        assert merged.n_records == whole.n_records
+        for col in digs_dict.values():
+            assert (merged.counts[col] == whole.counts[col]).all()
+        assert np.allclose(merged.moments, whole.moments)
+        assert parts[0].n_records < whole.n_records
+        assert parts[0].merge(parts[1]) is parts[0]
+        with pytest.raises(ValueError):
+            whole.merge(BenfordAccumulator(decimals=2))
+
+    @pytest.mark.parametrize('confidence', [None, 95, 99.9])
+    def test_bytes(self, gen_signed_array, confidence):
+        acc = BenfordAccumulator(decimals='infer', sign='neg', limit_N=500,
+                                 confidence=confidence)
+        acc.update(gen_signed_array)
+        buf = acc.to_bytes()
+        back = BenfordAccumulator.from_bytes(buf)
+        assert back.to_bytes() == buf
+        assert (back.decimals, back.sign, back.limit_N, back.confidence) == \
+            ('infer', 'neg', 500, confidence)
+        assert (back.n_seen, back.n_records) == (acc.n_seen, acc.n_records)
+        assert back.test('F2D').chi_square == acc.test('F2D').chi_square
+        assert (back.sums['F3D'] == acc.sums['F3D']).all()
+        with pytest.raises(ValueError):
+            BenfordAccumulator.from_bytes(buf[:-8])
+        with pytest.raises(ValueError):
+            BenfordAccumulator.from_bytes(b'XXXX' + buf[4:])
+        with pytest.raises(ValueError):
+            BenfordAccumulator.from_bytes(buf[:_HEADER_.size] + b'\x09' +
+                                          buf[_HEADER_.size + 1:])
+
+    def test_bytes_compact(self, gen_lognormal):
+        empty = BenfordAccumulator().to_bytes()
+        assert len(empty) < 1300
+        assert BenfordAccumulator.from_bytes(empty).n_records == 0
+        acc = BenfordAccumulator().update(gen_lognormal[:200])
+        buf = acc.to_bytes()
+        # one byte counts and only the sums of the bins with records
+        assert buf[_HEADER_.size] == 0
+        assert len(buf) < 4096
+        acc.update(gen_lognormal)
+        buf = acc.to_bytes()
+        assert len(buf) < 13000
+        assert BenfordAccumulator.from_bytes(buf).to_bytes() == buf
+
+    def test_bytes_version_1(self, gen_lognormal):
+        acc = BenfordAccumulator().update(gen_lognormal)
+        buf = acc.to_bytes()
+        old = _HEADER_.pack(*((_HEADER_.unpack_from(buf)[0], 1) +
+                              _HEADER_.unpack_from(buf)[2:]))
+        old += np.concatenate(list(acc.counts.values())).astype('<i8') \
+            .tobytes()
+        old += np.concatenate(list(acc.sums.values()) + [acc.moments]) \
+            .astype('<f8').tobytes()
+        assert BenfordAccumulator.from_bytes(old).to_bytes() == buf
@@ -0,0 +1,169 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..benford import benford as bf
+
+
+class Test_Benford_tests():
+
+    def test_subset(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, tests=['F1D', 22], verbose=False)
+        full = bf.Benford(gen_lognormal, verbose=False)
+        assert benf.tests == ['F1D', 'SD']
+        assert list(benf.base.columns) == ['seq', 'ZN', 'F1D', 'SD']
+        assert (benf.SD.Counts == full.SD.Counts).all()
+        assert benf._discarded == {'F1D': full._discarded['F1D'],
+                                   'SD': full._discarded['SD']}
+
+    def test_lazy(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, tests=['F1D'], verbose=False)
+        full = bf.Benford(gen_lognormal, verbose=False)
+        benf.update_confidence(99)
+        assert (benf.L2D.Counts == full.L2D.Counts).all()
+        assert benf.L2D.MAD == full.L2D.MAD
+        assert benf.tests == ['F1D', 'L2D']
+        assert benf.all_confidences == {'F1D': 99, 'L2D': 99}
+        assert benf._discarded['L2D'] == full._discarded['L2D']
+        with pytest.raises(AttributeError):
+            benf.F4D
+
+    def test_sec_order_summation(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, tests=['F2D'], sec_order=True,
+                          summation=True, verbose=False)
+        full = bf.Benford(gen_lognormal, sec_order=True, summation=True,
+                          verbose=False)
+        assert benf.tests == ['F2D', 'F2D_sec', 'F1D_Summ', 'F2D_Summ',
+                              'F3D_Summ']
+        assert (benf.F2D_sec.Counts == full.F2D_sec.Counts).all()
+        assert np.allclose(benf.F3D_Summ.Sum, full.F3D_Summ.Sum)
+
+    def test_sec_order_counts_only(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, sec_order=True, keep_base=False,
+                          verbose=False)
+        full = bf.Benford(gen_lognormal, sec_order=True, verbose=False)
+        assert benf.base_sec is None
+        assert benf._discarded_sec == full._discarded_sec
+        for test in ['F1D_sec', 'F2D_sec', 'F3D_sec', 'SD_sec', 'L2D_sec']:
+            assert (getattr(benf, test).Counts.values ==
+                    getattr(full, test).Counts.values).all()
+
+    def test_second_order_index(self, gen_lognormal):
+        # the differences do not depend on the records' index
+        data = pd.Series(gen_lognormal[:5000], index=pd.date_range(
+            '2020-01-01', periods=5000, freq='h'))
+        data.iloc[::10] = np.nan
+        sec = bf.second_order(data, 2, verbose=False, show_plot=False)
+        assert len(sec) == data.nunique() - 1
+        ref = bf.second_order(data.dropna().to_numpy(), 2, verbose=False,
+                              show_plot=False)
+        assert (sec.ZN.values == ref.ZN.values).all()
+
+    def test_mantissas_counts_only(self, gen_lognormal, capsys):
+        benf = bf.Benford(gen_lognormal, keep_base=False, mantissas=True,
+                          verbose=False)
+        # nothing to plot, which the default report skips
+        benf.Mantissas.report()
+        assert 'nothing to plot' in capsys.readouterr().out
+        with pytest.raises(ValueError):
+            benf.Mantissas.show_plot()
+
+    def test_counts_only(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, tests=['F1D'], keep_base=False,
+                          verbose=False)
+        with pytest.raises(AttributeError):
+            benf.F2D
+
+
+class Test_summation():
+
+    def test_summ(self, gen_lognormal):
+        benf = bf.Benford(gen_lognormal, tests=['F1D'], summation=True,
+                          verbose=False)
+        counts = bf.Benford(gen_lognormal, tests=['F1D'], summation=True,
+                            keep_base=False, verbose=False)
+        base = benf.base.loc[benf.base.F1D != -1]
+        found = base.seq.abs().groupby(base.F1D).sum()
+        assert (benf.F1D_Summ.index == found.index).all()
+        assert np.allclose(benf.F1D_Summ.Sum, found)
+        assert np.allclose(counts.F1D_Summ.Sum, found)
+        assert np.isclose(benf.F1D_Summ.MAD, counts.F1D_Summ.MAD)
+
+    def test_too_small(self):
+        # no record is large enough for the F3D Summation test
+        data = np.array([1.5, 2.25, 13.0, 45.1, 7.7, 88.8])
+        benf = bf.Benford(data, decimals=0, summation=True, verbose=False)
+        assert len(benf.F3D_Summ) == 0 and np.isnan(benf.F3D_Summ.MAD)
+        assert benf.F3D_Summ.expected == 1 / 900
+        assert benf.F1D_Summ.expected == 1 / 9
+
+    def test_source(self, gen_lognormal):
+        src = bf.Source(gen_lognormal, verbose=False)
+        df = src.summation(digs=2, show_plot=False, ret_df=True)
+        assert df.index.name == 'F2D'
+        assert list(df.columns) == ['Summ', 'Percent', 'AbsDif']
+        found = src.ZN.groupby(src.ZN.astype(str).str[:2].astype(int)).sum()
+        found = found.loc[found.index >= 10]
+        assert (df.Summ == found).all()
+        assert 'F2D' not in src.columns
+
+    def test_functions(self, gen_lognormal):
+        df = bf.summation(gen_lognormal, digs=2, verbose=False,
+                          show_plot=False)
+        mad = bf.mad_summ(gen_lognormal, test=2, verbose=False)
+        assert np.isclose(mad, df.AbsDif.mean())
+
+
+class Test_rolling_tests():
+
+    def test_matches_rolling_mad(self, gen_lognormal):
+        data = gen_lognormal[:3000] * 1000
+        res = bf.rolling_tests(data, 500, ['F1D', 22], ['MAD', 'MSE', 'KS'])
+        assert list(res.columns) == [('F1D', 'MAD'), ('F1D', 'MSE'),
+                                     ('F1D', 'KS'), ('SD', 'MAD'),
+                                     ('SD', 'MSE'), ('SD', 'KS')]
+        assert np.allclose(res['F1D', 'MAD'], bf.rolling_mad(data, 1, 500))
+        assert np.allclose(res['SD', 'MSE'], bf.rolling_mse(data, 22, 500))
+
+    def test_discarded(self):
+        data = np.array([5, 50, 500, 7, 70, 700] * 10, dtype=float)
+        res = bf.rolling_tests(data, 3, [3, 1], ['MAD'], decimals=0)
+        # the windows are the same for both tests, with a single record of
+        # three digits each, while rolling_mad's take only those records
+        assert len(res) == len(data) - 2
+        f3d = bf.rolling_mad(data, 3, 1, decimals=0)
+        assert len(f3d) == 20
+        assert np.allclose(res['F3D', 'MAD'].iloc[::3], f3d)
+        res = bf.rolling_tests(data, 1, [3], ['chi2'], decimals=0)
+        assert res['F3D', 'chi2'].isna().sum() == 40
+
+    def test_stats(self, gen_lognormal):
+        with pytest.raises(ValueError):
+            bf.rolling_tests(gen_lognormal, 100, stats=['MAD', 'Z_score'])
+
+
+class Test_expanding():
+
+    def test_matches_prefixes(self, gen_lognormal):
+        # the steps count only the records valid for the test
+        data = gen_lognormal[gen_lognormal >= 10][:2000]
+        res = bf.expanding(data, 2, ['N', 'MAD', 'chi2'], step=500)
+        assert len(res) == 4
+        for k in range(4):
+            test = bf.Benford(data[:500 * (k + 1)], tests=['F2D'],
+                              verbose=False).F2D
+            assert res.N.iloc[k] == test.N
+            assert res.MAD.iloc[k] == pytest.approx(test.MAD)
+            assert res.chi2.iloc[k] == pytest.approx(test.chi_square)
+
+    def test_every_record(self, gen_lognormal):
+        exp = bf.Expanding(gen_lognormal[:300], 1, ['N', 'MAD'])
+        assert exp.test == 1
+        assert (exp.stats.N == np.arange(1, 301)).all()
+        assert exp.roll_series.iloc[-1] == pytest.approx(bf.Benford(
+            gen_lognormal[:300], tests=[1], verbose=False).F1D.MAD)
+
+    def test_stats(self, gen_lognormal):
+        with pytest.raises(ValueError):
+            bf.expanding(gen_lognormal, 1, ['MAD', 'Z_score'])
+        with pytest.raises(ValueError):
+            bf.Expanding(gen_lognormal, 1, ['N']).show_plot()
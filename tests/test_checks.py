@@ -31,6 +31,9 @@ class Test_check_digs():
         assert str(
             context.value) == "The value assigned to the parameter -digs- was Two. Value must be 1, 2 or 3."
 
+    def test_valid(self):
+        assert ch._check_digs_(2) == 2
+
 
 class Test_check_test():
         
@@ -243,3 +246,13 @@ class Test_check_nunm_array():
     def test_tuple(self):
         with pytest.raises(ValueError) as context:
             ch._check_num_array_({1, 2, 3, 4})
+
+
+class Test_check_stats():
+
+    def test_stats(self):
+        assert ch._check_stats_(('MAD', 'N')) == ['MAD', 'N']
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            ch._check_stats_(['MAD', 'mad'])
@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+from os.path import dirname
+import pytest
+import numpy as np
+import pandas as pd
+from ..benford import benford as bf
+from ..benford import cli
+
+
+class Test_cli():
+
+    def test_jsonl(self, tmp_path, capsys):
+        np.random.seed(2)
+        frame = pd.DataFrame({'a': np.random.lognormal(3, 2, 2000).round(2),
+                              'b': np.random.randint(1, 10 ** 6, 2000)})
+        frame.to_csv(tmp_path / 'f.csv', index=False)
+        np.save(tmp_path / 'g.npy', frame.a.to_numpy())
+        (tmp_path / 'notes.txt').write_text('skipped')
+        assert cli.main([str(tmp_path), '-t', 'F1D,2', '-w', '1']) == 0
+        out, err = capsys.readouterr()
+        records = [json.loads(line) for line in out.splitlines()]
+        assert len(records) == 6
+        assert [(r['column'], r['test']) for r in records] == [
+            ('a', 'F1D'), ('a', 'F2D'), ('b', 'F1D'), ('b', 'F2D'),
+            (None, 'F1D'), (None, 'F2D')]
+        ref = bf.Benford((frame, 'a'), verbose=False)
+        assert records[1]['MAD'] == ref.F2D.MAD
+        assert records[1]['chi2_crit'] == ref.F2D.critical_values['chi2']
+        assert records[5]['N'] == ref.F2D.N
+        assert 'rows/s' in err
+
+    def test_csv_output(self, tmp_path):
+        np.random.randint(1, 10 ** 6, 500).astype('<i8').tofile(
+            tmp_path / 'h.i8')
+        out = tmp_path / 'out.csv'
+        assert cli.main([str(tmp_path / 'h.i8'), '-f', 'csv', '-o', str(out),
+                         '-d', '0', '-w', '1']) == 0
+        res = pd.read_csv(out)
+        assert list(res.columns) == cli.FIELDS
+        assert list(res.test) == ['F1D', 'F2D', 'F3D', 'SD', 'L2D']
+        assert (res.N + res.discarded == 500).all()
+
+    def test_decimals(self, tmp_path, capsys):
+        np.random.seed(3)
+        frame = pd.DataFrame({'a': np.random.lognormal(3, 2, 2000).round(3),
+                              'b': np.random.randint(1, 10 ** 6, 2000),
+                              'c': np.nan})
+        frame.to_csv(tmp_path / 'f.csv', index=False)
+        assert cli.main([str(tmp_path / 'f.csv'), '-t', 'L2D', '-d', 'a=3',
+                         '-w', '1']) == 0
+        out, _ = capsys.readouterr()
+        records = [json.loads(line) for line in out.splitlines()]
+        ref = bf.Benford((frame, 'a'), decimals=3, verbose=False)
+        assert records[0]['MAD'] == ref.L2D.MAD
+        # the integer column is not scaled by the default decimals
+        ref = bf.Benford((frame, 'b'), verbose=False)
+        assert records[1]['MAD'] == ref.L2D.MAD
+        assert records[2]['column'] == 'c'
+
+    def test_json_nan(self):
+        # JSON has no NaN nor Infinity
+        assert [cli._float_(v) for v in [np.nan, np.inf, None, 2]] == [
+            None, None, None, 2.]
+
+    def test_bad_arguments(self, tmp_path, capsys):
+        for args in [['-t', 'F9D'], ['-d', 'x'], ['-d', 'a=-1']]:
+            with pytest.raises(SystemExit) as err:
+                cli.main([str(tmp_path)] + args)
+            assert err.value.code == 2
+            assert 'invalid' in capsys.readouterr().err
+
+    def test_missing_file(self, tmp_path, capsys):
+        assert cli.main([str(tmp_path / 'none.csv'), '-w', '1']) == 1
+
+    def test_no_matplotlib(self):
+        code = ('import sys\nfrom benford import cli\n'
+                'print("matplotlib" in sys.modules)')
+        res = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                             text=True, cwd=dirname(dirname(cli.__file__)))
+        assert res.stdout.strip() == 'False'
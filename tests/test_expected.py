@@ -41,3 +41,19 @@ class Test__lt_():
         lt = ex._lt_(num=True)
         assert len(lt) == 100
         assert lt.dtype == 'int64'
+
+
+class Test__expected_():
+
+    @pytest.mark.parametrize('digs', [1, 2, 3, 22, -2])
+    def test_cached_read_only(self, digs):
+        exp, ind = ex._expected_(digs)
+        assert ex._expected_(digs)[0] is exp
+        assert not exp.flags.writeable
+        assert not ind.flags.writeable
+        assert list(ex._index_(digs)) == list(ind)
+        assert ex._test_(digs).Expected.tolist() == exp.tolist()
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            ex._expected_(4)
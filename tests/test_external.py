@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from ..benford import external as ex
+from ..benford.utils import sorted_diffs
+
+
+class Test_external_sort():
+
+    def test_merge_runs(self):
+        rng = np.random.default_rng(2)
+        runs = [np.sort(rng.integers(0, 20, n)).astype(float)
+                for n in [0, 5, 13, 1, 40]]
+        chunks = list(ex.merge_runs(runs, block=10))
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        assert np.array_equal(np.concatenate(chunks),
+                              np.sort(np.concatenate(runs)))
+
+    def test_sorted_runs(self, gen_messy_array, tmp_path):
+        paths = ex.sorted_runs(gen_messy_array, tmp_path, run_size=30000,
+                               sign='pos')
+        assert len(paths) == 4
+        runs = [np.load(path) for path in paths]
+        assert all((np.diff(run) >= 0).all() and (run > 0).all()
+                   for run in runs)
+        assert sum(map(len, runs)) == (gen_messy_array > 0).sum()
+
+    @pytest.mark.parametrize('run_size, block', [(10 ** 6, 100),
+                                                 (20000, 4096), (7001, 64)])
+    def test_matches_sorted_diffs(self, gen_messy_array, run_size, block):
+        diffs = np.concatenate(list(ex.external_sorted_diffs(
+            gen_messy_array, run_size, block)))
+        assert np.array_equal(diffs, sorted_diffs(gen_messy_array))
+
+    def test_sign(self, gen_messy_array, tmp_path):
+        diffs = np.concatenate(list(ex.external_sorted_diffs(
+            gen_messy_array, 20000, sign='neg', tmpdir=tmp_path)))
+        neg = gen_messy_array[gen_messy_array < 0]
+        assert np.array_equal(diffs, sorted_diffs(neg))
+        # the temporary runs are removed
+        assert not list(tmp_path.iterdir())
+
+    def test_errors(self):
+        assert list(ex.external_sorted_diffs(np.array([]))) == []
+        with pytest.raises(ValueError):
+            list(ex.external_sorted_diffs(np.arange(10.), run_size=0))
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from os.path import dirname
+
+
+CODE = """
+import sys
+import benford
+print('matplotlib' in sys.modules, 'benford.viz' in sys.modules)
+"""
+
+
+def test_import_skips_matplotlib():
+    res = subprocess.run([sys.executable, '-c', CODE], capture_output=True,
+                         text=True, cwd=dirname(dirname(__file__)))
+    assert res.stdout.strip() == 'False False'
+
+
+def test_plot_imports_matplotlib():
+    code = ('import sys\nfrom benford import expected\n'
+            'import matplotlib\nmatplotlib.use("Agg")\n'
+            'expected.First(1, plot=True)\n'
+            'print("matplotlib.pyplot" in sys.modules)')
+    res = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                         text=True, cwd=dirname(dirname(__file__)))
+    assert res.stdout.strip().endswith('True')
@@ -0,0 +1,94 @@
+import pytest
+import numpy as np
+from ..benford import benford as bf
+from ..benford.monitor import EWMAMonitor, DriftMonitor
+
+
+class Test_EWMAMonitor():
+
+    def test_no_decay_matches_Test(self, gen_lognormal):
+        mon = EWMAMonitor('F2D', half_life=np.inf)
+        for chunk in np.array_split(gen_lognormal, 7):
+            mon.update(chunk)
+        ref = bf.Benford(gen_lognormal, tests=['F2D'], verbose=False).F2D
+        assert mon.n_seen == ref.N
+        assert mon.N == pytest.approx(ref.N)
+        assert mon.MAD == pytest.approx(ref.MAD)
+        assert mon.chi_square == pytest.approx(ref.chi_square)
+        assert np.allclose(mon.Z_score, ref.Z_score)
+
+    def test_weights(self, gen_lognormal):
+        whole = EWMAMonitor(1, half_life=500).update(gen_lognormal)
+        mon = EWMAMonitor(1, half_life=500)
+        for chunk in np.array_split(gen_lognormal, 13):
+            mon.update(chunk)
+        assert np.allclose(mon.counts, whole.counts)
+        digits = bf.Benford(gen_lognormal, tests=[1],
+                            verbose=False).base.F1D.to_numpy()
+        digits = digits[digits > 0]
+        weights = 0.5 ** (np.arange(len(digits))[::-1] / 500)
+        assert np.allclose(mon.counts, np.bincount(digits - 1, weights,
+                                                   minlength=9))
+        assert mon.N == pytest.approx(weights.sum() ** 2 /
+                                      (weights ** 2).sum())
+
+    def test_recent_profile(self, gen_lognormal):
+        mon = EWMAMonitor(1, half_life=100).update(gen_lognormal)
+        assert mon.MAD < 0.02
+        # a burst of records starting with 5 takes over the profile
+        mon.update(np.full(1000, 512.34))
+        assert mon.proportions[5] > 0.99
+        assert mon.Z_score[5] > 10
+
+    def test_empty(self):
+        mon = EWMAMonitor('SD', half_life=10)
+        assert mon.N == 0
+        assert np.isnan(mon.MAD)
+        assert mon.Z_score.isna().all()
+        with pytest.raises(ValueError):
+            EWMAMonitor(half_life=0)
+
+
+class Test_DriftMonitor():
+
+    def test_alarms(self, gen_lognormal):
+        events = []
+        mon = DriftMonitor(tests=['F1D', 'SD'], confidence=99.9,
+                           half_life=2000, callbacks=[events.append])
+        for chunk in np.array_split(gen_lognormal, 20):
+            mon.update(chunk)
+        assert not any(mon.alarms.values())
+        events.clear()
+        # records all starting with 5
+        fired = mon.update(np.full(2000, 512.34))
+        assert fired == events
+        assert {(e.test, e.stat) for e in fired} == set(mon.alarms)
+        assert all(e.alarm and e.value > e.threshold for e in fired)
+        assert all(mon.alarms.values())
+        events.clear()
+        for chunk in np.array_split(gen_lognormal, 20):
+            mon.update(chunk)
+        assert not any(mon.alarms.values())
+        assert all(not e.alarm and e.value <= e.threshold * 0.9
+                   for e in events)
+
+    def test_min_N(self, gen_lognormal):
+        mon = DriftMonitor(tests=[1], min_N=500)
+        assert mon.update(np.full(499, 512.34)) == []
+        assert mon.monitors['F1D'].n_seen == 499
+        fired = mon.update(np.full(1, 512.34))
+        assert {e.stat for e in fired} == {'MAD', 'chi2', 'KS'}
+
+    def test_thresholds(self, gen_lognormal):
+        mon = DriftMonitor(tests=['F2D', 'L2D'], confidence=None)
+        assert list(mon.alarms) == [('F2D', 'MAD')]
+        mon = DriftMonitor(tests=['F2D'], confidence=99)
+        mon.update(gen_lognormal)
+        thr = mon.thresholds('F2D')
+        assert thr['MAD'] == 0.0022
+        assert thr['chi2'] == 122.942
+        assert thr['KS'] == pytest.approx(1.63 / mon.monitors['F2D'].N ** 0.5)
+        with pytest.raises(ValueError):
+            DriftMonitor(stats=['MSE'])
+        with pytest.raises(ValueError):
+            DriftMonitor(hysteresis=1)
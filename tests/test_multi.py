@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..benford import benford as bf
+from ..benford.multi import analyze_columns, analyze_groups
+
+
+class Test_analyze_columns():
+
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    def test_matches_Benford(self, gen_frame, executor):
+        summary, tests = analyze_columns(gen_frame, decimals={'a': 'infer',
+                                         'b': 0, 'c': 2}, workers=2,
+                                         executor=executor)
+        assert list(tests) == ['a', 'b', 'c']
+        assert summary.shape == (15, 5)
+        for col, dec in [('a', 'infer'), ('b', 0), ('c', 2)]:
+            benf = bf.Benford((gen_frame, col), decimals=dec, verbose=False)
+            for test in benf.tests:
+                ref = getattr(benf, test)
+                assert (tests[col][test].Counts.values ==
+                        ref.Counts.values).all()
+                assert summary.loc[(col, test), 'MAD'] == pytest.approx(
+                    ref.MAD)
+                assert summary.loc[(col, test), 'N'] == ref.N
+
+    def test_columns(self, gen_frame):
+        summary, tests = analyze_columns(gen_frame, columns=['c'],
+                                         confidence=99, limit_N=100)
+        assert list(summary.index.get_level_values('column').unique()) == ['c']
+        assert tests['c']['F1D'].confidence == 99
+        assert (summary.N == 100).all()
+
+    def test_executor(self, gen_frame):
+        with pytest.raises(ValueError):
+            analyze_columns(gen_frame, executor='cluster')
+
+
+class Test_analyze_groups():
+
+    @pytest.mark.parametrize('test', ['F1D', 'F2D', 'SD', 'L2D'])
+    def test_matches_Benford(self, gen_frame, test):
+        frame = gen_frame.assign(g=np.arange(len(gen_frame)) % 7)
+        results, Z = analyze_groups(frame, 'b', 'g', test, decimals=0,
+                                    sign='pos', Z_scores=True)
+        assert list(results.index) == list(range(7))
+        assert list(results.columns) == ['N', 'chi2', 'KS', 'MAD', 'MSE']
+        for g in [0, 6]:
+            ref = getattr(bf.Benford(frame.loc[frame.g == g, 'b'].to_numpy(),
+                                     decimals=0, sign='pos', verbose=False),
+                          test)
+            assert results.loc[g, 'N'] == ref.N
+            assert results.loc[g, 'chi2'] == pytest.approx(ref.chi_square)
+            assert results.loc[g, 'KS'] == pytest.approx(ref.KS)
+            assert results.loc[g, 'MAD'] == pytest.approx(ref.MAD)
+            assert np.allclose(Z.loc[g], ref.Z_score)
+
+    def test_limit_N(self, gen_frame):
+        frame = gen_frame.assign(g=np.arange(len(gen_frame)) % 3)
+        results = analyze_groups(frame, 'a', 'g', limit_N=100)
+        assert (results.N == 100).all()
+        with pytest.raises(ValueError):
+            analyze_groups(frame, 'a', 'g', limit_N=2.5)
@@ -0,0 +1,122 @@
+import pytest
+import numpy as np
+import pandas as pd
+from ..benford import benford as bf
+from ..benford import readers as rd
+from ..benford import utils as ut
+from ..benford.constants import digs_dict
+
+
+def _assert_same_(acc, benf):
+    assert acc.n_records == len(benf.base)
+    for col in digs_dict.values():
+        test, ref = acc.test(col), getattr(benf, col)
+        assert (test.Counts.values == ref.Counts.values).all()
+        assert test.chi_square == pytest.approx(ref.chi_square)
+        assert test.MAD == pytest.approx(ref.MAD)
+
+
+class Test_readers():
+
+    def test_read_npy(self, gen_signed_lognormal, tmp_path):
+        path = tmp_path / 'col.npy'
+        np.save(path, gen_signed_lognormal)
+        acc = rd.read_npy(path, window=1000, decimals='infer', sign='neg')
+        _assert_same_(acc, bf.Benford(gen_signed_lognormal, decimals='infer',
+                                      sign='neg', verbose=False))
+
+    def test_read_raw_float(self, gen_signed_lognormal, tmp_path):
+        path = tmp_path / 'col.f8'
+        gen_signed_lognormal.astype('<f8').tofile(path)
+        acc = rd.read_raw(path, 'float64', window=999)
+        _assert_same_(acc, bf.Benford(gen_signed_lognormal, verbose=False))
+
+    def test_read_raw_int(self, gen_signed_lognormal, tmp_path):
+        arr = gen_signed_lognormal.astype(np.int64)
+        path = tmp_path / 'col.i8'
+        arr.astype('<i8').tofile(path)
+        acc = rd.read_raw(path, window=4096, decimals=0)
+        _assert_same_(acc, bf.Benford(arr, decimals=0, verbose=False))
+
+    def test_read_npy_sec_order(self, gen_signed_lognormal, tmp_path):
+        path = tmp_path / 'col.npy'
+        np.save(path, gen_signed_lognormal)
+        acc = rd.read_npy(path, sec_order=True, run_size=3000, sign='neg')
+        ref = bf.second_order(gen_signed_lognormal, 2, sign='neg', verbose=False,
+                              show_plot=False)
+        assert acc.n_records == len(ref)
+        test = acc.test(2, sec_order=True)
+        assert test.name == 'First Two Digits Second Order Test'
+        assert (test.Counts.values == ut.digit_counts(ut.extract_digits(
+            ref.ZN, ['F2D'])['F2D'], 2)).all()
+
+    def test_sec_order_run_size(self, gen_signed_lognormal):
+        benf = bf.Benford(gen_signed_lognormal, sec_order=True, verbose=False)
+        ooc = bf.Benford(gen_signed_lognormal, verbose=False)
+        ooc.sec_order(run_size=2500)
+        assert ooc.base_sec is None
+        assert ooc._discarded_sec == benf._discarded_sec
+        for col in digs_dict.values():
+            assert (getattr(ooc, f'{col}_sec').Counts.values ==
+                    getattr(benf, f'{col}_sec').Counts.values).all()
+
+    def test_read_raw_empty(self, tmp_path):
+        path = tmp_path / 'empty.i8'
+        path.write_bytes(b'')
+        assert rd.read_raw(path).n_seen == 0
+
+    def test_errors(self, tmp_path):
+        with pytest.raises(ValueError):
+            rd.read_raw(tmp_path / 'x', dtype='int32')
+        with pytest.raises(ValueError):
+            rd.accumulate(np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            rd.accumulate(np.zeros(2), window=0)
+
+    def test_read_csv(self, tmp_path):
+        np.random.seed(5)
+        frame = pd.DataFrame({'a': np.random.lognormal(3, 2, 3000).round(3),
+                              'b': np.random.randint(-5000, 5000, 3000),
+                              'c': ['x'] * 3000})
+        frame.loc[::13, 'a'] = np.nan
+        path = tmp_path / 'data.csv'
+        frame.to_csv(path, index=False)
+        accs = rd.read_csv(path, ['a', 'b'], chunksize=250,
+                           decimals={'a': 3, 'b': 0})
+        assert list(accs) == ['a', 'b']
+        _assert_same_(accs['a'], bf.Benford((frame, 'a'), decimals=3,
+                                            verbose=False))
+        _assert_same_(accs['b'], bf.Benford((frame, 'b'), decimals=0,
+                                            verbose=False))
+        summ = accs['b'].summation('F1D')
+        ref = bf.Benford((frame, 'b'), verbose=False, summation=True)
+        assert np.allclose(summ.Sum, ref.F1D_Summ.Sum)
+
+    def test_read_csv_integers(self, tmp_path):
+        # integer columns are not scaled by the default decimals
+        np.random.seed(6)
+        frame = pd.DataFrame({'a': np.random.lognormal(3, 2, 5000).round(2),
+                              'b': np.random.randint(1, 10 ** 6, 5000)})
+        # missing values in the last chunk only, which is parsed as floats
+        frame['b'] = frame.b.astype('Int64')
+        frame.loc[4500:, 'b'] = pd.NA
+        path = tmp_path / 'data.csv'
+        frame.to_csv(path, index=False)
+        accs = rd.read_csv(path, ['a', 'b'], chunksize=1000)
+        _assert_same_(accs['a'], bf.Benford((frame, 'a'), verbose=False))
+        ints = frame.b.dropna().astype('int64')
+        _assert_same_(accs['b'], bf.Benford(ints, verbose=False))
+        assert accs['b'].counts['L2D'].min() > 0
+
+    def test_read_csv_float_then_int(self, tmp_path):
+        # the second chunk holds no fraction, and is parsed as integers
+        floats = np.random.RandomState(7).lognormal(3, 2, 1000)
+        lines = ['a'] + [f'{v:.2f}' for v in floats] + \
+            [str(v) for v in range(1, 1001)]
+        path = tmp_path / 'data.csv'
+        path.write_text('\n'.join(lines) + '\n')
+        chunks = pd.read_csv(path, chunksize=1000)
+        assert [c.a.dtype.kind for c in chunks] == ['f', 'i']
+        accs = rd.read_csv(path, ['a'], chunksize=1000)
+        _assert_same_(accs['a'], bf.Benford((pd.read_csv(path), 'a'),
+                                            verbose=False))
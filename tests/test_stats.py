@@ -159,3 +159,20 @@ class Test_chi_sq():
         assert chis[1] == crit_chi2[ddf][99.99999]
         assert chis[0] > 0
         assert isinstance(chis[0], float)
+
+
+def test_tests_by_row():
+    import numpy as np
+    from ..benford.benford import Test
+    from ..benford.expected import _test_
+    counts = np.random.randint(0, 50, (4, 90))
+    expected = _test_(2).Expected.to_numpy()
+    N = counts.sum(axis=1)
+    rows = st.tests_by_row(counts, expected, N)
+    for i in range(4):
+        test = Test(None, 2, 95, counts=counts[i])
+        assert rows['chi2'][i] == pytest.approx(test.chi_square)
+        assert rows['KS'][i] == pytest.approx(test.KS)
+        assert rows['MAD'][i] == pytest.approx(test.MAD)
+        assert rows['MSE'][i] == pytest.approx(test.MSE)
+        assert np.allclose(rows['Z_score'][i], test.Z_score)
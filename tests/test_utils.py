@@ -1,6 +1,10 @@
+import warnings
 import pytest
+import numpy as np
 import pandas as pd
 from ..benford import utils as ut
+from ..benford.constants import rev_digs
+from ..benford.expected import _test_
 
 
 class Test_set_N_():
@@ -75,6 +79,39 @@ class Test_set_sign():
         assert sum(sign_df.seq >= 0) == 0
 
 
+class Test_infer_ZN():
+
+    def test_str_equivalent(self, gen_array):
+        arr = np.concatenate([gen_array, np.round(gen_array, 2),
+                              np.array([1., 20., .0012, 120.5, .1 + .2])])
+        arr = arr[arr >= 1e-4]
+        ZN = ut.infer_ZN(arr)
+        ZN_str = pd.Series(arr).astype(str).str.replace('.', '')\
+            .str.lstrip('0').str[:5].astype(int)
+        assert (ZN == ZN_str.values).all()
+
+    def test_values(self):
+        ZN = ut.infer_ZN(np.array([1.5, 20., .0123, 123456.7, 0.]))
+        assert (ZN == [15, 200, 123, 12345, 0]).all()
+
+    def test_large_magnitudes(self):
+        rng = np.random.RandomState(5)
+        arr = np.concatenate([
+            rng.rand(2000) * 10. ** rng.randint(-320, 308, 2000),
+            np.round(rng.rand(500), 3) * 10. ** rng.randint(-300, 300, 500),
+            [3.2e200, 7.1e160, np.finfo(float).max, 1e308, 9.99e307,
+             1e22, 1e23, 2.5e-310]])
+        arr = arr[arr > 0]
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            ZN = ut.infer_ZN(arr)
+        # the digits of the repr's mantissa, which is what infer means for
+        # the records shown in scientific notation
+        ZN_str = [int(repr(x).partition('e')[0].replace('.', '')
+                      .lstrip('0')[:5]) for x in arr.tolist()]
+        assert (ZN == ZN_str).all()
+
+
 class Test_get_times_10_power():
         
     def test_2(self, gen_data_frame):
@@ -97,6 +134,79 @@ class Test_get_times_10_power():
         assert (pow_df.ZN.astype(str).str.len() == 5).all()
 
 
+class Test_extract_digits():
+
+    def test_all_cols(self, gen_int_df):
+        ZN = gen_int_df.seq.loc[gen_int_df.seq >= 1000]
+        digs = ut.extract_digits(ZN)
+        assert list(digs.keys()) == ['F1D', 'F2D', 'F3D', 'SD', 'L2D']
+        for k in [1, 2, 3]:
+            assert (digs[f'F{k}D'] == ZN // 10 ** (
+                np.log10(ZN).astype(int) - (k - 1))).all()
+        assert (digs['SD'] == digs['F2D'] % 10).all()
+        assert (digs['L2D'] == ZN % 100).all()
+
+    def test_small_values(self):
+        digs = ut.extract_digits(np.array([0, 7, 42, 123, 98765]))
+        assert (digs['F1D'] == [-1, 7, 4, 1, 9]).all()
+        assert (digs['F2D'] == [-1, -1, 42, 12, 98]).all()
+        assert (digs['F3D'] == [-1, -1, -1, 123, 987]).all()
+        assert (digs['SD'] == [-1, -1, 2, 2, 8]).all()
+        assert (digs['L2D'] == [-1, -1, -1, -1, 65]).all()
+
+    def test_powers_of_ten(self):
+        ZN = np.array([10 ** 12 - 1, 10 ** 12, 10 ** 18 - 1, 10 ** 18,
+                       2 ** 63 - 1])
+        digs = ut.extract_digits(ZN)
+        assert (digs['F1D'] == [9, 1, 9, 1, 9]).all()
+        assert (digs['F3D'] == [999, 100, 999, 100, 922]).all()
+        assert (digs['SD'] == [9, 0, 9, 0, 2]).all()
+
+    def test_cols(self):
+        digs = ut.extract_digits(np.array([123, 98765]), ['SD', 'F1D'])
+        assert list(digs.keys()) == ['SD', 'F1D']
+        assert (digs['SD'] == [2, 8]).all()
+        assert (digs['F1D'] == [1, 9]).all()
+
+    def test_compact(self, gen_int_df):
+        ZN = gen_int_df.seq
+        digs = ut.extract_digits(ZN)
+        comp = ut.extract_digits(ZN, compact=True)
+        for col, arr in comp.items():
+            assert arr.dtype == ('uint16' if col == 'F3D' else 'uint8')
+            kept = digs[col] != -1
+            assert ((arr == ut._sentinel_(arr.dtype)) == ~kept).all()
+            assert (arr[kept] == digs[col][kept]).all()
+
+
+def test_narrow_uint():
+    assert ut.narrow_uint(np.array([1, 255])).dtype == 'uint8'
+    assert ut.narrow_uint(np.array([1, 70000])).dtype == 'uint32'
+    assert ut.narrow_uint(np.array([], dtype=int)).dtype == 'uint8'
+
+
+class Test_scale_records():
+
+    def test_sign(self):
+        arr = np.array([-2.5, 0, np.nan, 1.25, 3.])
+        seq, ZN = ut.scale_records(arr)
+        assert list(seq) == [-2.5, 1.25, 3.]
+        assert list(ZN) == [250, 125, 300]
+        seq, ZN = ut.scale_records(arr, decimals='infer', sign='neg')
+        assert list(ZN) == [25]
+        seq, ZN = ut.scale_records(arr, decimals=0, sign='pos')
+        assert list(ZN) == [1, 3]
+
+    def test_int(self):
+        _, ZN = ut.scale_records(np.array([-12, 0, 7], dtype='int32'), 2)
+        assert ZN.dtype == 'int64'
+        assert list(ZN) == [12, 7]
+
+    def test_type(self):
+        with pytest.raises(TypeError):
+            ut.scale_records(np.array(['1', '2']))
+
+
 class Test_get_digs():
         
     def test_dec_8(self, gen_array):
@@ -165,6 +275,14 @@ class Test_get_proportions():
         assert prop_l2d.Counts.dtype == int
 
 
+def test_get_proportions_bincount(gen_get_digs_df, choose_test):
+    digits = gen_get_digs_df[choose_test]
+    prop = ut.get_proportions(digits)
+    assert (prop.Counts == digits.value_counts().sort_index()).all()
+    assert np.allclose(prop.Found,
+                       digits.value_counts(normalize=True).sort_index())
+
+
 class Test_join_exp_found_diff():
         
     def test_F1D(self, gen_proportions_F1D):
@@ -296,8 +414,210 @@ class Test_prepare():
         assert num == n_diff
 
 
+def test_prepare_bincount(gen_get_digs_df, choose_test):
+    digits = gen_get_digs_df[choose_test]
+    digits = digits.loc[digits != -1]
+    N, prep = ut.prepare(digits, rev_digs[choose_test])
+    joined = ut.join_expect_found_diff(ut.get_proportions(digits),
+                                       rev_digs[choose_test])
+    assert N == len(digits)
+    assert (prep.index == joined.index).all()
+    assert np.allclose(prep[joined.columns], joined)
+
+
 def test_subtract_sorted(gen_series):
     ser = gen_series
     sort = ut.subtract_sorted(ser)
     assert len(ser) - len(sort) >= 1
     assert (sort != 0).all()
+
+
+def test_sorted_diffs():
+    arr = np.array([5, 1, np.nan, 3, 3, 10, np.nan])
+    diffs = ut.sorted_diffs(arr)
+    assert diffs.dtype == np.float64
+    assert list(diffs) == [2, 2, 5]
+    assert np.isnan(arr[2])
+    ints = np.array([7, 2, 2, 4])
+    assert list(ut.sorted_diffs(ints)) == [2, 3]
+    assert list(ints) == [7, 2, 2, 4]
+    owned = np.array([3., 1., 2.])
+    assert list(ut.sorted_diffs(owned, overwrite=True)) == [1, 1]
+    assert list(owned) == [1, 2, 3]
+
+
+class Test_digit_counts():
+
+    def test_F1D(self, gen_get_digs_df):
+        counts = ut.digit_counts(gen_get_digs_df.F1D, 1)
+        assert len(counts) == 9
+        assert counts.sum() == (gen_get_digs_df.F1D != -1).sum()
+
+    def test_random_test(self, gen_get_digs_df, choose_test):
+        digs = rev_digs[choose_test]
+        counts = ut.digit_counts(gen_get_digs_df[choose_test], digs)
+        found = gen_get_digs_df[choose_test].value_counts()
+        exp = _test_(digs)
+        assert len(counts) == len(exp)
+        assert (counts == found.reindex(exp.index).fillna(0).values).all()
+
+    def test_weights(self):
+        sums = ut.digit_counts(np.array([1, 1, 9, -1]), 1,
+                               weights=np.array([1., 2., 3., 4.]))
+        assert sums[0] == 3. and sums[8] == 3. and sums.sum() == 6.
+
+
+class Test_digit_sums():
+
+    def test_floats(self):
+        sums = ut.digit_sums(np.array([1, 1, 9, -1]), 1,
+                             np.array([1.5, 2., 3., 4.]))
+        assert sums.dtype == np.float64
+        assert sums[0] == 3.5 and sums[8] == 3. and sums.sum() == 6.5
+
+    def test_ints_exact(self):
+        # float64 sums would lose the units past 2 ** 53
+        big = 2 ** 53 + 1
+        sums = ut.digit_sums(np.array([9, 9, 1]), 1,
+                             np.array([big, big, 5], dtype=np.int64))
+        assert sums.dtype == np.int64
+        assert sums[8] == 2 * big and sums[0] == 5
+
+    def test_ints_overflow(self):
+        big = np.iinfo(np.int64).max // 2 + 1
+        sums = ut.digit_sums(np.array([9, 9]), 1,
+                             np.array([big, big], dtype=np.int64))
+        assert sums.dtype == np.float64
+        assert sums[8] == 2. * big
+
+    def test_random_test(self, gen_get_digs_df, choose_test):
+        digs = rev_digs[choose_test]
+        digits = gen_get_digs_df[choose_test]
+        values = np.arange(len(digits))
+        sums = ut.digit_sums(digits, digs, values)
+        found = pd.Series(values, index=digits.values).groupby(level=0).sum()
+        exp = _test_(digs)
+        assert len(sums) == len(exp)
+        assert (sums == found.reindex(exp.index).fillna(0).values).all()
+
+
+def test_mantissas_stats(gen_array):
+    mant = pd.Series(ut.get_mantissas(gen_array[gen_array > 0]))
+    stats = ut.mantissas_stats(ut.mantissa_moments(mant))
+    assert np.isclose(stats['Mean'], mant.mean(), equal_nan=True)
+    assert np.isclose(stats['Var'], mant.var(), equal_nan=True)
+    assert np.isclose(stats['Skew'], mant.skew(), equal_nan=True)
+    assert np.isclose(stats['Kurt'], mant.kurt(), equal_nan=True)
+
+
+class Test_window_counts():
+
+    def test_brute_force(self):
+        rng = np.random.default_rng(0)
+        bins = rng.integers(0, 7, 1000)
+        starts = np.sort(rng.integers(0, 900, 300))
+        ends = np.maximum.accumulate(np.minimum(
+            starts + rng.integers(0, 100, 300), 1000))
+        blocks = [counts for _, counts in ut.window_counts(
+            bins, 7, starts, ends, block=17)]
+        expected = [np.bincount(bins[s:e], minlength=7)
+                    for s, e in zip(starts, ends)]
+        assert (np.vstack(blocks) == np.array(expected)).all()
+
+
+class Test_rolling_stats():
+
+    def test_matches_prepare(self):
+        rng = np.random.default_rng(1)
+        digits = pd.Series(rng.integers(10, 100, 300))
+        digits[::7] = -1
+        res = ut.rolling_stats(digits, 2, 50, ['MAD', 'MSE', 'chi2', 'KS'])
+        valid = digits.loc[digits != -1]
+        assert len(res) == len(valid) - 49
+        assert res.index[0] == valid.index[49]
+        for i in [0, 10, len(res) - 1]:
+            _, dd = ut.prepare(valid.iloc[i:i + 50], 2)
+            assert res.MAD.iloc[i] == pytest.approx(dd.AbsDif.mean())
+            assert res.MSE.iloc[i] == pytest.approx((dd.AbsDif ** 2).mean())
+
+    def test_window(self):
+        digits = pd.Series(np.arange(1, 10))
+        assert ut.rolling_stats(digits, 1, 20).empty
+        with pytest.raises(ValueError):
+            ut.rolling_stats(digits, 1, 0)
+
+    def test_step(self):
+        rng = np.random.default_rng(2)
+        digits = pd.Series(rng.integers(1, 10, 200))
+        full = ut.rolling_stats(digits, 1, 50, ['MAD'])
+        res = ut.rolling_stats(digits, 1, 50, ['MAD'], step=30)
+        assert list(res.index) == list(full.index[::30])
+        assert np.allclose(res.MAD, full.MAD.iloc[::30])
+
+    def test_time_window(self):
+        rng = np.random.default_rng(3)
+        index = pd.DatetimeIndex(np.sort(rng.integers(0, 200, 400)) *
+                                 np.timedelta64(1, 'D') +
+                                 np.datetime64('2020-01-01'))
+        digits = pd.Series(rng.integers(1, 10, 400), index=index)
+        res = ut.rolling_stats(digits, 1, '30D', ['MAD'])
+        expected = digits.rolling('30D').apply(
+            lambda w: ut.prepare(pd.Series(w), 1)[1].AbsDif.mean(), raw=True)
+        assert len(res) == len(digits)
+        assert np.allclose(res.MAD, expected)
+        monthly = ut.rolling_stats(digits, 1, '30D', ['MAD'], step='ME')
+        assert (monthly.index == pd.date_range(
+            '2020-01-31', periods=len(monthly), freq='ME')).all()
+        end = monthly.index[-1]
+        last = digits.loc[digits.index > end - pd.Timedelta('30D')]
+        assert monthly.MAD.iloc[-1] == pytest.approx(
+            ut.prepare(last, 1)[1].AbsDif.mean())
+
+    def test_period_step_intraday(self):
+        # records later in the day than the first one stay in their period
+        index = pd.DatetimeIndex(['2024-01-01 09:00', '2024-01-15 12:00',
+                                  '2024-01-31 15:00', '2024-02-10 08:00',
+                                  '2024-02-29 23:30'])
+        digits = pd.Series([1, 2, 3, 4, 5], index=index)
+        res = ut.rolling_stats(digits, 1, None, ['N'], step='ME')
+        assert list(res.index) == list(pd.to_datetime(['2024-01-31',
+                                                       '2024-02-29']))
+        assert list(res.N) == [3, 5]
+        # the periods shorter than a day are labelled by their start
+        hourly = ut.rolling_stats(digits.iloc[:3], 1, '12h', ['N'],
+                                  step='12h')
+        assert list(hourly.index) == list(pd.to_datetime(
+            ['2024-01-01 00:00', '2024-01-15 12:00', '2024-01-31 12:00']))
+        assert list(hourly.N) == [1, 1, 1]
+
+    def test_daily_step(self):
+        # a record at midnight starts its day, the later ones stay in it
+        index = pd.DatetimeIndex(['2024-01-01 00:00', '2024-01-01 23:59',
+                                  '2024-01-02 00:00', '2024-01-03 12:00'])
+        digits = pd.Series([1, 2, 3, 4], index=index)
+        res = ut.rolling_stats(digits, 1, '1D', ['N'], step='D')
+        assert list(res.index) == list(pd.date_range('2024-01-01',
+                                                     periods=3))
+        assert list(res.N) == [2, 1, 1]
+        weekly = ut.rolling_stats(digits, 1, None, ['N'], step='7D')
+        assert list(weekly.index) == [pd.Timestamp('2024-01-01')]
+        assert list(weekly.N) == [4]
+
+    def test_month_start_step(self):
+        index = pd.DatetimeIndex(['2024-01-10 08:00', '2024-01-31 23:00',
+                                  '2024-02-01 00:00', '2024-03-05 10:00'])
+        digits = pd.Series([1, 2, 3, 4], index=index)
+        res = ut.rolling_stats(digits, 1, None, ['N'], step='MS')
+        assert list(res.index) == list(pd.date_range('2024-01-01',
+                                                     periods=3, freq='MS'))
+        assert list(res.N) == [2, 3, 4]
+
+    def test_time_window_index(self):
+        digits = pd.Series(np.arange(1, 10))
+        with pytest.raises(ValueError):
+            ut.rolling_stats(digits, 1, '30D')
+        with pytest.raises(ValueError):
+            ut.rolling_stats(digits, 1, 3, step='ME')
+        unsorted = digits.set_axis(pd.date_range('2020-01-01', periods=9)[::-1])
+        with pytest.raises(ValueError):
+            ut.rolling_stats(unsorted, 1, '30D')